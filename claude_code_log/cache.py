@@ -2,6 +2,7 @@
 """Cache management for Claude Code Log to improve performance."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, cast
 from datetime import datetime
@@ -465,8 +466,13 @@ class CacheManager:
         }
 
 
+@lru_cache(maxsize=1)
 def get_library_version() -> str:
-    """Get the current library version from package metadata or pyproject.toml."""
+    """Get the current library version from package metadata or pyproject.toml.
+
+    The result is cached for the lifetime of the process, as the installed
+    version cannot change while running.
+    """
     # First try to get version from installed package metadata
     try:
         from importlib.metadata import version
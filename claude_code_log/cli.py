@@ -5,7 +5,7 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Optional, List
 
 import click
 from git import Repo, InvalidGitRepositoryError
@@ -89,7 +89,10 @@ def convert_project_path_to_claude_dir(input_path: Path) -> Path:
 
 
 def find_projects_by_cwd(
-    projects_dir: Path, current_cwd: Optional[str] = None
+    projects_dir: Path,
+    current_cwd: Optional[str] = None,
+    *,
+    cache_factory: Optional[Callable[[Path, str], CacheManager]] = None,
 ) -> List[Path]:
     """Find Claude projects that match the current working directory.
 
@@ -97,6 +100,9 @@ def find_projects_by_cwd(
     1. Exact match to current working directory
     2. Git repository root match
     3. Relative path matching
+
+    cache_factory builds the per-project cache manager used for relative
+    matching, and defaults to CacheManager.
     """
     if current_cwd is None:
         current_cwd = os.getcwd()
@@ -124,7 +130,9 @@ def find_projects_by_cwd(
         return git_root_matches
 
     # Tier 3: Fall back to relative path matching
-    return _find_relative_matches(project_dirs, current_cwd_path)
+    return _find_relative_matches(
+        project_dirs, current_cwd_path, cache_factory or CacheManager
+    )
 
 
 def _find_exact_matches(project_dirs: List[Path], current_cwd_path: Path) -> List[Path]:
@@ -158,15 +166,21 @@ def _find_git_root_matches(
 
 
 def _find_relative_matches(
-    project_dirs: List[Path], current_cwd_path: Path
+    project_dirs: List[Path],
+    current_cwd_path: Path,
+    cache_factory: Callable[[Path, str], CacheManager],
 ) -> List[Path]:
     """Find projects using relative path matching (original behavior)."""
     relative_matches: List[Path] = []
 
+    # Every directory the current cwd sits inside (including itself), so each
+    # project working directory is a single set lookup rather than a prefix walk
+    cwd_ancestors = {current_cwd_path, *current_cwd_path.parents}
+
     for project_dir in project_dirs:
         try:
             # Load cache to check for working directories
-            cache_manager = CacheManager(project_dir, get_library_version())
+            cache_manager = cache_factory(project_dir, get_library_version())
             project_cache = cache_manager.get_cached_project_data()
 
             # Build cache if needed
@@ -184,11 +198,11 @@ def _find_relative_matches(
 
             if project_cache and project_cache.working_directories:
                 # Check for relative matches
-                for cwd in project_cache.working_directories:
-                    cwd_path = Path(cwd).resolve()
-                    if current_cwd_path.is_relative_to(cwd_path):
-                        relative_matches.append(project_dir)
-                        break
+                if any(
+                    Path(cwd).resolve() in cwd_ancestors
+                    for cwd in project_cache.working_directories
+                ):
+                    relative_matches.append(project_dir)
             else:
                 # Fall back to path name matching if no cache data
                 project_name = project_dir.name
@@ -218,8 +232,7 @@ def _find_relative_matches(
                             reconstructed_path = Path(drive)
 
                 if reconstructed_path and (
-                    current_cwd_path == reconstructed_path
-                    or current_cwd_path.is_relative_to(reconstructed_path)
+                    reconstructed_path in cwd_ancestors
                     or reconstructed_path.is_relative_to(current_cwd_path)
                 ):
                     relative_matches.append(project_dir)
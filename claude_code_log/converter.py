@@ -26,9 +26,13 @@ from .models import (
     UserTranscriptEntry,
 )
 from .renderer import (
-    generate_html,
-    generate_session_html,
-    generate_projects_index_html,
+    # Re-exported, callers import these from here
+    generate_html as generate_html,
+    generate_session_html as generate_session_html,
+    generate_projects_index_html as generate_projects_index_html,
+    write_html,
+    write_session_html,
+    write_projects_index_html,
     is_html_outdated,
     get_project_display_name,
 )
@@ -121,8 +125,7 @@ def convert_jsonl_to_html(
         json_path.write_text(json.dumps(json_data, indent=2), encoding="utf-8")
         print(f"Exported {len(messages)} messages to {json_path}")
 
-        html_content = generate_html(messages, title)
-        output_path.write_text(html_content, encoding="utf-8")
+        write_html(output_path, messages, title)
     else:
         print(f"HTML file {output_path.name} is current, skipping regeneration")
 
@@ -528,12 +531,10 @@ def _generate_individual_session_files(
         )
 
         if should_regenerate_session:
-            # Generate session HTML
-            session_html = generate_session_html(
-                messages, session_id, session_title, cache_manager
+            # Stream session HTML to its file
+            write_session_html(
+                session_file_path, messages, session_id, session_title, cache_manager
             )
-            # Write session file
-            session_file_path.write_text(session_html, encoding="utf-8")
         else:
             print(
                 f"Session file {session_file_path.name} is current, skipping regeneration"
@@ -743,8 +744,7 @@ def process_projects_hierarchy(
         all_projects_json_path.write_text(json.dumps(json_data, indent=2, default=str), encoding="utf-8")
         print(f"Exported {len(project_summaries)} projects summary to {all_projects_json_path}")
 
-        index_html = generate_projects_index_html(project_summaries, from_date, to_date)
-        index_path.write_text(index_html, encoding="utf-8")
+        write_projects_index_html(index_path, project_summaries, from_date, to_date)
     else:
         print("Index HTML is current, skipping regeneration")
 
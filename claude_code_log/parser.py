@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 """Parse and extract data from Claude transcript JSONL files."""
 
-import json
+import mmap
+import os
+from functools import lru_cache
 from pathlib import Path
 import re
-from typing import Any, List, Optional, Union, TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Union, TYPE_CHECKING
 from datetime import datetime
 import dateparser
+import orjson
 
 from .models import (
     TranscriptEntry,
@@ -25,30 +28,35 @@ def extract_text_content(content: Union[str, List[ContentItem], None]) -> str:
     """Extract text content from Claude message content structure (supports both custom and Anthropic types)."""
     if content is None:
         return ""
-    if isinstance(content, list):
-        text_parts: List[str] = []
-        for item in content:
-            # Handle both custom TextContent and official Anthropic TextBlock
-            if isinstance(item, TextContent):
-                text_parts.append(item.text)
-            elif (
-                hasattr(item, "type")
-                and hasattr(item, "text")
-                and getattr(item, "type") == "text"
-            ):
-                # Official Anthropic TextBlock
-                text_parts.append(getattr(item, "text"))
-            elif isinstance(item, ThinkingContent):
-                # Skip thinking content in main text extraction
-                continue
-            elif hasattr(item, "type") and getattr(item, "type") == "thinking":
-                # Skip official Anthropic thinking content too
-                continue
-        return "\n".join(text_parts)
-    else:
-        return str(content) if content else ""
-
-
+    if isinstance(content, str):
+        return content
+    match content:
+        case [TextContent(text=text)]:
+            # Fast path for the common single text block message
+            return text
+        case list():
+            text_parts: List[str] = []
+            for item in content:
+                # Handle both custom TextContent and official Anthropic TextBlock
+                if isinstance(item, TextContent):
+                    text_parts.append(item.text)
+                elif (
+                    hasattr(item, "type")
+                    and hasattr(item, "text")
+                    and getattr(item, "type") == "text"
+                ):
+                    # Official Anthropic TextBlock
+                    text_parts.append(getattr(item, "text"))
+                elif isinstance(item, ThinkingContent):
+                    # Skip thinking content in main text extraction
+                    continue
+                elif hasattr(item, "type") and getattr(item, "type") == "thinking":
+                    # Skip official Anthropic thinking content too
+                    continue
+            return "\n".join(text_parts)
+
+
+@lru_cache(maxsize=4096)
 def parse_timestamp(timestamp_str: str) -> Optional[datetime]:
     """Parse ISO timestamp to datetime object."""
     try:
@@ -114,14 +122,112 @@ def filter_messages_by_date(
     return filtered_messages
 
 
+# Read buffer for transcript files, 8x Python's default to cut read syscalls
+# on multi-megabyte transcripts
+TRANSCRIPT_READ_BUFFER_SIZE = 64 * 1024
+
+# Transcripts larger than this are memory-mapped and split into lines in C
+TRANSCRIPT_MMAP_THRESHOLD = 1024 * 1024
+
+
+def _loads_line(line: Union[str, bytes]) -> Any:
+    """Decode one JSONL line, replacing invalid UTF-8 rather than rejecting it."""
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError:
+        if isinstance(line, str):
+            raise
+        return orjson.loads(line.decode("utf-8", errors="replace"))
+
+
+def _line_text(line: Union[str, bytes, Dict[str, Any]]) -> str:
+    """Return a JSONL line as text for error reporting."""
+    if isinstance(line, bytes):
+        return line.decode("utf-8", errors="replace")
+    return str(line)
+
+
+def _parse_transcript_lines(
+    lines: Iterable[Union[str, bytes, Dict[str, Any]]], source: str
+) -> List[TranscriptEntry]:
+    """Parse JSONL lines into transcript entries, reporting bad lines by source.
+
+    Entries that are already decoded into dicts are validated directly.
+    """
+    messages: List[TranscriptEntry] = []
+
+    for line_no, line in enumerate(lines):
+        if not isinstance(line, dict):
+            line = line.strip()
+        if line:
+            try:
+                entry_dict: dict[str, Any] | str = (
+                    line if isinstance(line, dict) else _loads_line(line)
+                )
+                if not isinstance(entry_dict, dict):
+                    print(
+                        f"Line {line_no} of {source} is not a JSON object: {_line_text(line)}"
+                    )
+                    continue
+
+                entry_type: str | None = entry_dict.get("type")
+
+                if entry_type in ["user", "assistant", "summary", "system"]:
+                    # Parse using Pydantic models
+                    entry = parse_transcript_entry(entry_dict)
+                    messages.append(entry)
+                else:
+                    print(
+                        f"Line {line_no} of {source} is not a recognised message type: {_line_text(line)}"
+                    )
+            except orjson.JSONDecodeError as e:
+                print(f"Line {line_no} of {source} | JSON decode error: {str(e)}")
+            except ValueError as e:
+                # Extract a more descriptive error message
+                error_msg = str(e)
+                if "validation error" in error_msg.lower():
+                    err_no_url = re.sub(
+                        r"    For further information visit https://errors.pydantic(.*)\n?",
+                        "",
+                        error_msg,
+                    )
+                    print(f"Line {line_no} of {source} | {err_no_url}")
+                else:
+                    print(
+                        f"Line {line_no} of {source} | ValueError: {error_msg}"
+                        "\n{traceback.format_exc()}"
+                    )
+            except Exception as e:
+                print(
+                    f"Line {line_no} of {source} | Unexpected error: {str(e)}"
+                    "\n{traceback.format_exc()}"
+                )
+
+    return messages
+
+
 def load_transcript(
-    jsonl_path: Path,
+    jsonl_path: Union[Path, str, "os.PathLike[str]", TextIO, List[Dict[str, Any]]],
     cache_manager: Optional["CacheManager"] = None,
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
     silent: bool = False,
 ) -> List[TranscriptEntry]:
-    """Load and parse JSONL transcript file, using cache if available."""
+    """Load and parse JSONL transcript file, using cache if available.
+
+    An already open text stream (such as ``io.StringIO``) or a list of
+    already decoded entry dicts is also accepted and parsed directly,
+    bypassing the cache. String paths are treated like ``Path`` objects.
+    """
+    if isinstance(jsonl_path, list):
+        return _parse_transcript_lines(jsonl_path, "<entries>")
+    if isinstance(jsonl_path, (str, os.PathLike)):
+        jsonl_path = Path(jsonl_path)
+    else:
+        return _parse_transcript_lines(
+            jsonl_path, getattr(jsonl_path, "name", "<stream>")
+        )
+
     # Try to load from cache first
     if cache_manager is not None:
         # Use filtered loading if date parameters are provided
@@ -137,57 +243,17 @@ def load_transcript(
                 print(f"Loading {jsonl_path} from cache...")
             return cached_entries
 
-    # Parse from source file
-    messages: List[TranscriptEntry] = []
-
-    with open(jsonl_path, "r", encoding="utf-8", errors="replace") as f:
+    # Parse from source file, handing raw bytes straight to orjson
+    with open(jsonl_path, "rb", buffering=TRANSCRIPT_READ_BUFFER_SIZE) as f:
         if not silent:
             print(f"Processing {jsonl_path}...")
-        for line_no, line in enumerate(f):
-            line = line.strip()
-            if line:
-                try:
-                    entry_dict: dict[str, Any] | str = json.loads(line)
-                    if not isinstance(entry_dict, dict):
-                        print(
-                            f"Line {line_no} of {jsonl_path} is not a JSON object: {line}"
-                        )
-                        continue
-
-                    entry_type: str | None = entry_dict.get("type")
-
-                    if entry_type in ["user", "assistant", "summary", "system"]:
-                        # Parse using Pydantic models
-                        entry = parse_transcript_entry(entry_dict)
-                        messages.append(entry)
-                    else:
-                        print(
-                            f"Line {line_no} of {jsonl_path} is not a recognised message type: {line}"
-                        )
-                except json.JSONDecodeError as e:
-                    print(
-                        f"Line {line_no} of {jsonl_path} | JSON decode error: {str(e)}"
-                    )
-                except ValueError as e:
-                    # Extract a more descriptive error message
-                    error_msg = str(e)
-                    if "validation error" in error_msg.lower():
-                        err_no_url = re.sub(
-                            r"    For further information visit https://errors.pydantic(.*)\n?",
-                            "",
-                            error_msg,
-                        )
-                        print(f"Line {line_no} of {jsonl_path} | {err_no_url}")
-                    else:
-                        print(
-                            f"Line {line_no} of {jsonl_path} | ValueError: {error_msg}"
-                            "\n{traceback.format_exc()}"
-                        )
-                except Exception as e:
-                    print(
-                        f"Line {line_no} of {jsonl_path} | Unexpected error: {str(e)}"
-                        "\n{traceback.format_exc()}"
-                    )
+        if os.fstat(f.fileno()).st_size > TRANSCRIPT_MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                messages = _parse_transcript_lines(
+                    iter(mm.readline, b""), str(jsonl_path)
+                )
+        else:
+            messages = _parse_transcript_lines(f, str(jsonl_path))
 
     # Save to cache if cache manager is available
     if cache_manager is not None:
@@ -206,8 +272,9 @@ def load_directory_transcripts(
     """Load all JSONL transcript files from a directory and combine them."""
     all_messages: List[TranscriptEntry] = []
 
-    # Find all .jsonl files
-    jsonl_files = list(directory_path.glob("*.jsonl"))
+    # Find all .jsonl files, in a stable order so that messages with equal
+    # timestamps keep the same relative order across runs
+    jsonl_files = sorted(directory_path.glob("*.jsonl"))
 
     for jsonl_file in jsonl_files:
         messages = load_transcript(
@@ -2,15 +2,24 @@
 """Render Claude transcript data to HTML format."""
 
 import json
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Union, Dict, Any, cast, TYPE_CHECKING
+from typing import List, Optional, Union, Dict, Any, Tuple, cast, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .cache import CacheManager
 from datetime import datetime
 import html
 import mistune
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+import orjson
+from jinja2 import (
+    Environment,
+    FileSystemLoader,
+    select_autoescape,
+)
+from jinja2.environment import TemplateStream
 
 from .models import (
     AssistantTranscriptEntry,
@@ -36,6 +45,16 @@ from .utils import (
 )
 from .cache import get_library_version
 
+# Command message tags, compiled once as they are matched for every command
+_COMMAND_NAME_RE = re.compile(r"<command-name>([^<]+)</command-name>")
+_COMMAND_ARGS_RE = re.compile(r"<command-args>([^<]*)</command-args>")
+_COMMAND_CONTENTS_RE = re.compile(
+    r"<command-contents>(.+?)</command-contents>", re.DOTALL
+)
+_LOCAL_COMMAND_STDOUT_RE = re.compile(
+    r"<local-command-stdout>(.*?)</local-command-stdout>", re.DOTALL
+)
+
 
 def get_project_display_name(
     project_dir_name: str, working_directories: Optional[List[str]] = None
@@ -50,13 +69,10 @@ def get_project_display_name(
         The project display name (e.g., "claude-code-log")
     """
     if working_directories:
-        # Convert to Path objects with their original indices for tracking recency
-        paths_with_indices = [(Path(wd), i) for i, wd in enumerate(working_directories)]
-
-        # Sort by: 1) path depth (fewer parts = less nested), 2) recency (lower index = more recent)
-        # This gives us the least nested path, with ties broken by recency
-        best_path, _ = min(paths_with_indices, key=lambda p: (len(p[0].parts), p[1]))
-        return best_path.name
+        # Pick the least nested path in a single pass. min() keeps the first of
+        # equally shallow paths, so ties go to the most recent (lowest index)
+        best_dir = min(working_directories, key=lambda wd: len(Path(wd).parts))
+        return Path(best_dir).name
     else:
         # Fall back to converting project directory name
         display_name = project_dir_name
@@ -108,6 +124,7 @@ def is_html_outdated(html_file_path: Path) -> bool:
     return html_version != current_version
 
 
+@lru_cache(maxsize=4096)
 def format_timestamp(timestamp_str: str | None) -> str:
     """Format ISO timestamp for display, converting to UTC."""
     if timestamp_str is None:
@@ -170,10 +187,11 @@ def create_collapsible_details(
     """
 
 
-def render_markdown(text: str) -> str:
-    """Convert markdown text to HTML using mistune."""
+@lru_cache(maxsize=1)
+def _get_markdown_renderer() -> mistune.Markdown:
+    """Get the shared mistune renderer, building its plugin pipeline once."""
     # Configure mistune with GitHub-flavored markdown features
-    renderer = mistune.create_markdown(
+    return mistune.create_markdown(
         plugins=[
             "strikethrough",
             "footnotes",
@@ -185,45 +203,43 @@ def render_markdown(text: str) -> str:
         escape=False,  # Don't escape HTML since we want to render markdown properly
         hard_wrap=True,  # Line break for newlines (checklists in Assistant messages)
     )
-    return str(renderer(text))
 
 
+@lru_cache(maxsize=1024)
+def render_markdown(text: str) -> str:
+    """Convert markdown text to HTML using mistune."""
+    return str(_get_markdown_renderer()(text))
+
+
+@lru_cache(maxsize=256)
 def extract_command_info(text_content: str) -> tuple[str, str, str]:
     """Extract command info from system message with command tags."""
-    import re
-
     # Extract command name
-    command_name_match = re.search(
-        r"<command-name>([^<]+)</command-name>", text_content
-    )
+    command_name_match = _COMMAND_NAME_RE.search(text_content)
     command_name = (
         command_name_match.group(1).strip() if command_name_match else "system"
     )
 
     # Extract command args
-    command_args_match = re.search(
-        r"<command-args>([^<]*)</command-args>", text_content
-    )
+    command_args_match = _COMMAND_ARGS_RE.search(text_content)
     command_args = command_args_match.group(1).strip() if command_args_match else ""
 
     # Extract command contents
-    command_contents_match = re.search(
-        r"<command-contents>(.+?)</command-contents>", text_content, re.DOTALL
-    )
+    command_contents_match = _COMMAND_CONTENTS_RE.search(text_content)
     command_contents: str = ""
     if command_contents_match:
         contents_text = command_contents_match.group(1).strip()
-        # Try to parse as JSON and extract the text field
-        try:
-            contents_json: Any = json.loads(contents_text)
-            if isinstance(contents_json, dict) and "text" in contents_json:
-                text_dict = cast(Dict[str, Any], contents_json)
-                text_value = text_dict["text"]
-                command_contents = str(text_value)
-            else:
-                command_contents = contents_text
-        except json.JSONDecodeError:
-            command_contents = contents_text
+        command_contents = contents_text
+        # Try to parse as JSON and extract the text field, only bothering
+        # when the contents could be a JSON object
+        if contents_text.startswith("{"):
+            try:
+                contents_json: Any = orjson.loads(contents_text)
+                if isinstance(contents_json, dict) and "text" in contents_json:
+                    text_dict = cast(Dict[str, Any], contents_json)
+                    command_contents = str(text_dict["text"])
+            except orjson.JSONDecodeError:
+                pass
 
     return command_name, command_args, command_contents
 
@@ -418,8 +434,6 @@ def _looks_like_bash_output(content: str) -> bool:
     ]
 
     # Check for file path patterns that suggest command output
-    import re
-
     if re.search(r"/[a-zA-Z0-9_-]+(/[a-zA-Z0-9_.-]+)*", content):  # Unix-style paths
         return True
 
@@ -541,12 +555,19 @@ def render_message_content(
     return "\n".join(rendered_parts)
 
 
+@lru_cache(maxsize=1)
 def _get_template_environment() -> Environment:
-    """Get Jinja2 template environment."""
+    """Get Jinja2 template environment.
+
+    The environment is shared so compiled templates are reused between renders.
+    Templates ship with the package, so they aren't re-checked for changes on
+    every lookup.
+    """
     templates_dir = Path(__file__).parent / "templates"
     return Environment(
         loader=FileSystemLoader(templates_dir),
         autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=False,
     )
 
 
@@ -739,8 +760,6 @@ def _convert_ansi_to_html(text: str) -> str:
     - Reset (0, 39, 49, 22, 23, 24)
     - Strips cursor movement and screen manipulation codes
     """
-    import re
-
     # First, strip cursor movement and screen manipulation codes
     # Common patterns: [1A (cursor up), [2K (erase line), [?25l (hide cursor), etc.
     cursor_patterns = [
@@ -1006,15 +1025,9 @@ def _process_command_message(text_content: str) -> tuple[str, str, str]:
 
 def _process_local_command_output(text_content: str) -> tuple[str, str, str]:
     """Process local command output and return (css_class, content_html, message_type)."""
-    import re
-
     css_class = "system command-output"
 
-    stdout_match = re.search(
-        r"<local-command-stdout>(.*?)</local-command-stdout>",
-        text_content,
-        re.DOTALL,
-    )
+    stdout_match = _LOCAL_COMMAND_STDOUT_RE.search(text_content)
     if stdout_match:
         stdout_content = stdout_match.group(1).strip()
         # Convert ANSI codes to HTML for colored display
@@ -1033,8 +1046,6 @@ def _process_local_command_output(text_content: str) -> tuple[str, str, str]:
 
 def _process_bash_input(text_content: str) -> tuple[str, str, str]:
     """Process bash input command and return (css_class, content_html, message_type)."""
-    import re
-
     css_class = "bash-input"
 
     bash_match = re.search(
@@ -1058,8 +1069,6 @@ def _process_bash_input(text_content: str) -> tuple[str, str, str]:
 
 def _process_bash_output(text_content: str) -> tuple[str, str, str]:
     """Process bash output and return (css_class, content_html, message_type)."""
-    import re
-
     css_class = "bash-output"
 
     stdout_match = re.search(
@@ -1135,6 +1144,37 @@ def generate_session_html(
     cache_manager: Optional["CacheManager"] = None,
 ) -> str:
     """Generate HTML for a single session using Jinja2 templates."""
+    session_messages, title, combined_link = _session_transcript_args(
+        messages, session_id, title, cache_manager
+    )
+    return generate_html(
+        session_messages, title, combined_transcript_link=combined_link
+    )
+
+
+def write_session_html(
+    output_path: Path,
+    messages: List[TranscriptEntry],
+    session_id: str,
+    title: Optional[str] = None,
+    cache_manager: Optional["CacheManager"] = None,
+) -> None:
+    """Render a single session straight to an HTML file."""
+    session_messages, title, combined_link = _session_transcript_args(
+        messages, session_id, title, cache_manager
+    )
+    write_html(
+        output_path, session_messages, title, combined_transcript_link=combined_link
+    )
+
+
+def _session_transcript_args(
+    messages: List[TranscriptEntry],
+    session_id: str,
+    title: Optional[str],
+    cache_manager: Optional["CacheManager"],
+) -> Tuple[List[TranscriptEntry], str, Optional[str]]:
+    """Pick out a session's messages, title and combined transcript link."""
     # Filter messages for this session only
     session_messages = [
         msg
@@ -1147,19 +1187,7 @@ def generate_session_html(
     if cache_manager is not None:
         combined_link = _get_combined_transcript_link(cache_manager)
 
-    if not session_messages:
-        return generate_html(
-            [],
-            title or f"Session {session_id[:8]}",
-            combined_transcript_link=combined_link,
-        )
-
-    # Use the existing generate_html function but with filtered messages and combined link
-    return generate_html(
-        session_messages,
-        title or f"Session {session_id[:8]}",
-        combined_transcript_link=combined_link,
-    )
+    return session_messages, title or f"Session {session_id[:8]}", combined_link
 
 
 def generate_html(
@@ -1171,6 +1199,58 @@ def generate_html(
     if not title:
         title = "Claude Transcript"
 
+    template = _get_template_environment().get_template("transcript.html")
+    return str(
+        template.render(
+            **_transcript_template_context(messages, title, combined_transcript_link)
+        )
+    )
+
+
+def write_html(
+    output_path: Path,
+    messages: List[TranscriptEntry],
+    title: Optional[str] = None,
+    combined_transcript_link: Optional[str] = None,
+) -> None:
+    """Render transcript messages straight to an HTML file.
+
+    The template output is streamed to disk in chunks instead of being built
+    up as one string first, which keeps memory down for large transcripts.
+    """
+    if not title:
+        title = "Claude Transcript"
+
+    template = _get_template_environment().get_template("transcript.html")
+    stream = template.stream(
+        **_transcript_template_context(messages, title, combined_transcript_link)
+    )
+    _dump_template_stream(stream, output_path)
+
+
+def _dump_template_stream(stream: TemplateStream, output_path: Path) -> None:
+    """Stream rendered output to a temp file, then move it onto output_path.
+
+    A render that fails partway leaves any previous file at output_path intact.
+    """
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as tmp_file:
+            stream.enable_buffering()
+            stream.dump(tmp_file)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _transcript_template_context(
+    messages: List[TranscriptEntry],
+    title: str,
+    combined_transcript_link: Optional[str],
+) -> Dict[str, Any]:
+    """Build the transcript.html template variables for a list of messages."""
+
     # Pre-process to find and attach session summaries
     session_summaries: Dict[str, str] = {}
     uuid_to_session: Dict[str, str] = {}
@@ -1612,26 +1692,49 @@ def generate_html(
             }
         )
 
-    # Render template
-    env = _get_template_environment()
-    template = env.get_template("transcript.html")
+    return {
+        "title": title,
+        "messages": template_messages,
+        "sessions": session_nav,
+        "combined_transcript_link": combined_transcript_link,
+        "library_version": get_library_version(),
+    }
+
+
+def generate_projects_index_html(
+    project_summaries: List[Dict[str, Any]],
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+) -> str:
+    """Generate an index HTML page listing all projects using Jinja2 templates."""
+    template = _get_template_environment().get_template("index.html")
     return str(
         template.render(
-            title=title,
-            messages=template_messages,
-            sessions=session_nav,
-            combined_transcript_link=combined_transcript_link,
-            library_version=get_library_version(),
+            **_projects_index_template_context(project_summaries, from_date, to_date)
         )
     )
 
 
-def generate_projects_index_html(
+def write_projects_index_html(
+    output_path: Path,
     project_summaries: List[Dict[str, Any]],
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
-) -> str:
-    """Generate an index HTML page listing all projects using Jinja2 templates."""
+) -> None:
+    """Render the projects index page straight to an HTML file."""
+    template = _get_template_environment().get_template("index.html")
+    stream = template.stream(
+        **_projects_index_template_context(project_summaries, from_date, to_date)
+    )
+    _dump_template_stream(stream, output_path)
+
+
+def _projects_index_template_context(
+    project_summaries: List[Dict[str, Any]],
+    from_date: Optional[str],
+    to_date: Optional[str],
+) -> Dict[str, Any]:
+    """Build the index.html template variables for a list of projects."""
     # Try to get a better title from working directories in projects
     title = "Claude Code Projects"
     if project_summaries:
@@ -1694,14 +1797,9 @@ def generate_projects_index_html(
     template_projects = [TemplateProject(project) for project in sorted_projects]
     template_summary = TemplateSummary(project_summaries)
 
-    # Render template
-    env = _get_template_environment()
-    template = env.get_template("index.html")
-    return str(
-        template.render(
-            title=title,
-            projects=template_projects,
-            summary=template_summary,
-            library_version=get_library_version(),
-        )
-    )
+    return {
+        "title": title,
+        "projects": template_projects,
+        "summary": template_summary,
+        "library_version": get_library_version(),
+    }
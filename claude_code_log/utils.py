@@ -7,15 +7,17 @@ from claude_code_log.cache import SessionCacheData
 from .models import ContentItem, TextContent, TranscriptEntry
 
 
+# Prefixes marking system messages, checked with a single str.startswith call
+SYSTEM_MESSAGE_PREFIXES = (
+    "Caveat: The messages below were generated by the user while running local commands. DO NOT respond to these messages or otherwise consider them in your response unless the user explicitly asks you to.",
+    "[Request interrupted by user for tool use]",
+    "<local-command-stdout>",
+)
+
+
 def is_system_message(text_content: str) -> bool:
     """Check if a message is a system message that should be filtered out."""
-    system_message_patterns = [
-        "Caveat: The messages below were generated by the user while running local commands. DO NOT respond to these messages or otherwise consider them in your response unless the user explicitly asks you to.",
-        "[Request interrupted by user for tool use]",
-        "<local-command-stdout>",
-    ]
-
-    return any(text_content.startswith(pattern) for pattern in system_message_patterns)
+    return text_content.startswith(SYSTEM_MESSAGE_PREFIXES)
 
 
 def is_command_message(text_content: str) -> bool:
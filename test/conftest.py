@@ -1,7 +1,45 @@
-"""Pytest configuration for timeline browser tests."""
+"""Shared pytest configuration and fixtures."""
+
+import importlib.util
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 import pytest
 
+PLAYWRIGHT_AVAILABLE = importlib.util.find_spec("playwright") is not None
+
+# These modules import Playwright at module level, so they can't even be
+# collected when it isn't installed
+collect_ignore = (
+    []
+    if PLAYWRIGHT_AVAILABLE
+    else ["test_timeline_browser.py", "test_query_params_browser.py"]
+)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip browser tests when Playwright isn't installed."""
+    if PLAYWRIGHT_AVAILABLE:
+        return
+
+    skip_browser = pytest.mark.skip(reason="Playwright is not installed")
+    for item in items:
+        if "browser" in item.keywords:
+            item.add_marker(skip_browser)
+
+
+@pytest.fixture(scope="session")
+def sidechain_html_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Sidechain transcript rendered once per session for the browser tests."""
+    from claude_code_log.parser import load_transcript
+    from claude_code_log.renderer import generate_html
+
+    messages = load_transcript(Path(__file__).parent / "test_data" / "sidechain.jsonl")
+    html_file = tmp_path_factory.mktemp("sidechain") / "sidechain.html"
+    html_file.write_text(generate_html(messages, "Sidechain"), encoding="utf-8")
+    return html_file
+
 
 @pytest.fixture(scope="session")
 def browser_context_args(browser_context_args):
@@ -21,3 +59,42 @@ def browser_type_launch_args(browser_type_launch_args):
         "headless": True,  # Set to False for debugging
         "slow_mo": 0,  # Add delay for debugging
     }
+
+
+@pytest.fixture(scope="session")
+def shared_browser_context(browser, browser_context_args):
+    """One browser context per worker, shared by all browser tests."""
+    context = browser.new_context(**browser_context_args)
+    yield context
+    context.close()
+
+
+@pytest.fixture
+def page(shared_browser_context):
+    """Fresh page in the shared context, instead of a new context per test.
+
+    The transcript pages only persist search state in localStorage, which
+    none of the browser tests use.
+    """
+    page = shared_browser_context.new_page()
+    yield page
+    page.close()
+
+
+@pytest.fixture
+def console_capture(page) -> List[Any]:
+    """Console messages logged by the page, captured from before navigation."""
+    messages: List[Any] = []
+    page.on("console", messages.append)
+    return messages
+
+
+@pytest.fixture(scope="session")
+def connect_options() -> Optional[Dict[str, Any]]:
+    """Connect to a running Playwright server instead of launching Chromium.
+
+    Set PLAYWRIGHT_WS_ENDPOINT (e.g. to the address printed by
+    `npx playwright run-server`) to share one browser across test workers.
+    """
+    ws_endpoint = os.environ.get("PLAYWRIGHT_WS_ENDPOINT")
+    return {"ws_endpoint": ws_endpoint} if ws_endpoint else None
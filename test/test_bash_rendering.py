@@ -1,15 +1,16 @@
 #!/usr/bin/env python3
 """Test cases for bash command rendering functionality."""
 
-import json
 import tempfile
 from pathlib import Path
 
+import orjson
+
 from claude_code_log.parser import load_transcript
 from claude_code_log.renderer import generate_html
 
 
-def test_bash_input_rendering():
+def test_bash_input_rendering(tmp_path):
     """Test that bash input commands are rendered with proper styling."""
     bash_input_message = {
         "type": "user",
@@ -27,30 +28,24 @@ def test_bash_input_rendering():
         },
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write(json.dumps(bash_input_message) + "\n")
-        f.flush()
-        test_file_path = Path(f.name)
-
-    try:
-        messages = load_transcript(test_file_path)
-        html = generate_html(messages, "Bash Test")
+    test_file_path = tmp_path / "test.jsonl"
+    test_file_path.write_bytes(orjson.dumps(bash_input_message) + b"\n")
 
-        # Check that bash prompt is rendered
-        assert "❯" in html, "Bash prompt symbol should be in HTML"
-        assert "bash-prompt" in html, "Bash prompt CSS class should be present"
-        assert "bash-command" in html, "Bash command CSS class should be present"
-        assert "pwd" in html, "The actual command should be visible"
+    messages = load_transcript(test_file_path)
+    html = generate_html(messages, "Bash Test")
 
-        # Check that raw tags are not visible
-        assert "<bash-input>" not in html, "Raw bash-input tags should not be visible"
-        assert "</bash-input>" not in html, "Raw bash-input tags should not be visible"
+    # Check that bash prompt is rendered
+    assert "❯" in html, "Bash prompt symbol should be in HTML"
+    assert "bash-prompt" in html, "Bash prompt CSS class should be present"
+    assert "bash-command" in html, "Bash command CSS class should be present"
+    assert "pwd" in html, "The actual command should be visible"
 
-    finally:
-        test_file_path.unlink()
+    # Check that raw tags are not visible
+    assert "<bash-input>" not in html, "Raw bash-input tags should not be visible"
+    assert "</bash-input>" not in html, "Raw bash-input tags should not be visible"
 
 
-def test_bash_stdout_rendering():
+def test_bash_stdout_rendering(tmp_path):
     """Test that bash stdout is rendered properly."""
     bash_output_message = {
         "type": "user",
@@ -68,31 +63,23 @@ def test_bash_stdout_rendering():
         },
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write(json.dumps(bash_output_message) + "\n")
-        f.flush()
-        test_file_path = Path(f.name)
-
-    try:
-        messages = load_transcript(test_file_path)
-        html = generate_html(messages, "Bash Output Test")
+    test_file_path = tmp_path / "test.jsonl"
+    test_file_path.write_bytes(orjson.dumps(bash_output_message) + b"\n")
 
-        # Check that stdout content is rendered
-        assert "/home/user/documents" in html, "Stdout content should be visible"
-        assert "bash-stdout" in html, "Bash stdout CSS class should be present"
+    messages = load_transcript(test_file_path)
+    html = generate_html(messages, "Bash Output Test")
 
-        # Check that raw tags are not visible
-        assert "<bash-stdout>" not in html, "Raw bash-stdout tags should not be visible"
-        assert "</bash-stdout>" not in html, (
-            "Raw bash-stdout tags should not be visible"
-        )
-        assert "<bash-stderr>" not in html, "Raw bash-stderr tags should not be visible"
+    # Check that stdout content is rendered
+    assert "/home/user/documents" in html, "Stdout content should be visible"
+    assert "bash-stdout" in html, "Bash stdout CSS class should be present"
 
-    finally:
-        test_file_path.unlink()
+    # Check that raw tags are not visible
+    assert "<bash-stdout>" not in html, "Raw bash-stdout tags should not be visible"
+    assert "</bash-stdout>" not in html, "Raw bash-stdout tags should not be visible"
+    assert "<bash-stderr>" not in html, "Raw bash-stderr tags should not be visible"
 
 
-def test_bash_stderr_rendering():
+def test_bash_stderr_rendering(tmp_path):
     """Test that bash stderr is rendered with error styling."""
     bash_error_message = {
         "type": "user",
@@ -110,30 +97,22 @@ def test_bash_stderr_rendering():
         },
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write(json.dumps(bash_error_message) + "\n")
-        f.flush()
-        test_file_path = Path(f.name)
+    test_file_path = tmp_path / "test.jsonl"
+    test_file_path.write_bytes(orjson.dumps(bash_error_message) + b"\n")
 
-    try:
-        messages = load_transcript(test_file_path)
-        html = generate_html(messages, "Bash Error Test")
+    messages = load_transcript(test_file_path)
+    html = generate_html(messages, "Bash Error Test")
 
-        # Check that stderr content is rendered
-        assert "Error: Permission denied" in html, "Stderr content should be visible"
-        assert "bash-stderr" in html, "Bash stderr CSS class should be present"
+    # Check that stderr content is rendered
+    assert "Error: Permission denied" in html, "Stderr content should be visible"
+    assert "bash-stderr" in html, "Bash stderr CSS class should be present"
 
-        # Check that raw tags are not visible
-        assert "<bash-stderr>" not in html, "Raw bash-stderr tags should not be visible"
-        assert "</bash-stderr>" not in html, (
-            "Raw bash-stderr tags should not be visible"
-        )
+    # Check that raw tags are not visible
+    assert "<bash-stderr>" not in html, "Raw bash-stderr tags should not be visible"
+    assert "</bash-stderr>" not in html, "Raw bash-stderr tags should not be visible"
 
-    finally:
-        test_file_path.unlink()
 
-
-def test_bash_empty_output_rendering():
+def test_bash_empty_output_rendering(tmp_path):
     """Test that empty bash output is handled gracefully."""
     bash_empty_message = {
         "type": "user",
@@ -151,24 +130,18 @@ def test_bash_empty_output_rendering():
         },
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write(json.dumps(bash_empty_message) + "\n")
-        f.flush()
-        test_file_path = Path(f.name)
-
-    try:
-        messages = load_transcript(test_file_path)
-        html = generate_html(messages, "Bash Empty Output Test")
+    test_file_path = tmp_path / "test.jsonl"
+    test_file_path.write_bytes(orjson.dumps(bash_empty_message) + b"\n")
 
-        # Check that empty output is handled
-        assert "(no output)" in html, "Empty output should show '(no output)' message"
-        assert "bash-empty" in html, "Bash empty CSS class should be present"
+    messages = load_transcript(test_file_path)
+    html = generate_html(messages, "Bash Empty Output Test")
 
-    finally:
-        test_file_path.unlink()
+    # Check that empty output is handled
+    assert "(no output)" in html, "Empty output should show '(no output)' message"
+    assert "bash-empty" in html, "Bash empty CSS class should be present"
 
 
-def test_bash_mixed_output_rendering():
+def test_bash_mixed_output_rendering(tmp_path):
     """Test that mixed stdout and stderr are both rendered."""
     bash_mixed_message = {
         "type": "user",
@@ -186,28 +159,22 @@ def test_bash_mixed_output_rendering():
         },
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write(json.dumps(bash_mixed_message) + "\n")
-        f.flush()
-        test_file_path = Path(f.name)
-
-    try:
-        messages = load_transcript(test_file_path)
-        html = generate_html(messages, "Bash Mixed Output Test")
+    test_file_path = tmp_path / "test.jsonl"
+    test_file_path.write_bytes(orjson.dumps(bash_mixed_message) + b"\n")
 
-        # Check that both stdout and stderr are rendered
-        assert "File created successfully" in html, "Stdout content should be visible"
-        assert "Warning: Overwriting existing file" in html, (
-            "Stderr content should be visible"
-        )
-        assert "bash-stdout" in html, "Bash stdout CSS class should be present"
-        assert "bash-stderr" in html, "Bash stderr CSS class should be present"
+    messages = load_transcript(test_file_path)
+    html = generate_html(messages, "Bash Mixed Output Test")
 
-    finally:
-        test_file_path.unlink()
+    # Check that both stdout and stderr are rendered
+    assert "File created successfully" in html, "Stdout content should be visible"
+    assert "Warning: Overwriting existing file" in html, (
+        "Stderr content should be visible"
+    )
+    assert "bash-stdout" in html, "Bash stdout CSS class should be present"
+    assert "bash-stderr" in html, "Bash stderr CSS class should be present"
 
 
-def test_bash_complex_command_rendering():
+def test_bash_complex_command_rendering(tmp_path):
     """Test rendering of complex bash commands with special characters."""
     bash_complex_message = {
         "type": "user",
@@ -225,28 +192,22 @@ def test_bash_complex_command_rendering():
         },
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write(json.dumps(bash_complex_message) + "\n")
-        f.flush()
-        test_file_path = Path(f.name)
-
-    try:
-        messages = load_transcript(test_file_path)
-        html = generate_html(messages, "Bash Complex Command Test")
+    test_file_path = tmp_path / "test.jsonl"
+    test_file_path.write_bytes(orjson.dumps(bash_complex_message) + b"\n")
 
-        # Check that complex command is properly escaped and rendered
-        assert "find . -name" in html, "Complex command should be visible"
-        assert "*.py" in html or "&#x27;*.py&#x27;" in html, (
-            "File pattern should be visible (possibly escaped)"
-        )
-        assert "xargs grep" in html, "Pipe commands should be visible"
-        assert "todo_files.txt" in html, "Output redirect should be visible"
+    messages = load_transcript(test_file_path)
+    html = generate_html(messages, "Bash Complex Command Test")
 
-    finally:
-        test_file_path.unlink()
+    # Check that complex command is properly escaped and rendered
+    assert "find . -name" in html, "Complex command should be visible"
+    assert "*.py" in html or "&#x27;*.py&#x27;" in html, (
+        "File pattern should be visible (possibly escaped)"
+    )
+    assert "xargs grep" in html, "Pipe commands should be visible"
+    assert "todo_files.txt" in html, "Output redirect should be visible"
 
 
-def test_bash_multiline_output_rendering():
+def test_bash_multiline_output_rendering(tmp_path):
     """Test rendering of multiline bash output."""
     bash_multiline_message = {
         "type": "user",
@@ -264,28 +225,22 @@ def test_bash_multiline_output_rendering():
         },
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write(json.dumps(bash_multiline_message) + "\n")
-        f.flush()
-        test_file_path = Path(f.name)
+    test_file_path = tmp_path / "test.jsonl"
+    test_file_path.write_bytes(orjson.dumps(bash_multiline_message) + b"\n")
 
-    try:
-        messages = load_transcript(test_file_path)
-        html = generate_html(messages, "Bash Multiline Output Test")
+    messages = load_transcript(test_file_path)
+    html = generate_html(messages, "Bash Multiline Output Test")
 
-        # Check that multiline content is preserved
-        assert "file1.txt" in html, "First line should be visible"
-        assert "file2.txt" in html, "Second line should be visible"
-        assert "nested_file.txt" in html, "Nested content should be visible"
+    # Check that multiline content is preserved
+    assert "file1.txt" in html, "First line should be visible"
+    assert "file2.txt" in html, "Second line should be visible"
+    assert "nested_file.txt" in html, "Nested content should be visible"
 
-        # Check that content is in a <pre> tag for formatting
-        assert "<pre" in html, "Output should be in a pre tag"
+    # Check that content is in a <pre> tag for formatting
+    assert "<pre" in html, "Output should be in a pre tag"
 
-    finally:
-        test_file_path.unlink()
 
-
-def test_bash_ansi_color_rendering():
+def test_bash_ansi_color_rendering(tmp_path):
     """Test that ANSI color codes in bash output are properly converted to HTML."""
     bash_output_with_colors = {
         "type": "user",
@@ -303,36 +258,30 @@ def test_bash_ansi_color_rendering():
         },
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write(json.dumps(bash_output_with_colors) + "\n")
-        f.flush()
-        test_file_path = Path(f.name)
-
-    try:
-        messages = load_transcript(test_file_path)
-        html = generate_html(messages, "Bash ANSI Color Test")
+    test_file_path = tmp_path / "test.jsonl"
+    test_file_path.write_bytes(orjson.dumps(bash_output_with_colors) + b"\n")
 
-        # Check that ANSI color codes were converted to HTML spans
-        assert '<span class="ansi-green">✔ Built extension in 1.234 s</span>' in html
-        assert '<span class="ansi-bold">Σ Total size: 620.55 kB</span>' in html
-        assert '<span class="ansi-dim">✔ Finished in 1.259 s</span>' in html
-        assert '<span class="ansi-red">Error: Test failed</span>' in html
+    messages = load_transcript(test_file_path)
+    html = generate_html(messages, "Bash ANSI Color Test")
 
-        # Check that both stdout and stderr are properly rendered
-        assert "bash-stdout" in html, "Bash stdout CSS class should be present"
-        assert "bash-stderr" in html, "Bash stderr CSS class should be present"
+    # Check that ANSI color codes were converted to HTML spans
+    assert '<span class="ansi-green">✔ Built extension in 1.234 s</span>' in html
+    assert '<span class="ansi-bold">Σ Total size: 620.55 kB</span>' in html
+    assert '<span class="ansi-dim">✔ Finished in 1.259 s</span>' in html
+    assert '<span class="ansi-red">Error: Test failed</span>' in html
 
-        # Ensure raw ANSI codes are not present
-        assert "\x1b[" not in html, "Raw ANSI escape codes should not be visible"
+    # Check that both stdout and stderr are properly rendered
+    assert "bash-stdout" in html, "Bash stdout CSS class should be present"
+    assert "bash-stderr" in html, "Bash stderr CSS class should be present"
 
-        # Check that the text content is preserved
-        assert "✔ Built extension in 1.234 s" in html
-        assert "Σ Total size: 620.55 kB" in html
-        assert "✔ Finished in 1.259 s" in html
-        assert "Error: Test failed" in html
+    # Ensure raw ANSI codes are not present
+    assert "\x1b[" not in html, "Raw ANSI escape codes should not be visible"
 
-    finally:
-        test_file_path.unlink()
+    # Check that the text content is preserved
+    assert "✔ Built extension in 1.234 s" in html
+    assert "Σ Total size: 620.55 kB" in html
+    assert "✔ Finished in 1.259 s" in html
+    assert "Error: Test failed" in html
 
 
 def test_bash_tool_result_ansi_processing():
@@ -389,7 +338,7 @@ def test_bash_tool_result_cursor_stripping():
     assert "\x1b[2K" not in html
 
 
-def test_bash_css_styles_included():
+def test_bash_css_styles_included(tmp_path):
     """Test that bash-specific CSS styles are included in the HTML."""
     bash_message = {
         "type": "user",
@@ -407,39 +356,34 @@ def test_bash_css_styles_included():
         },
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write(json.dumps(bash_message) + "\n")
-        f.flush()
-        test_file_path = Path(f.name)
-
-    try:
-        messages = load_transcript(test_file_path)
-        html = generate_html(messages, "Bash CSS Test")
+    test_file_path = tmp_path / "test.jsonl"
+    test_file_path.write_bytes(orjson.dumps(bash_message) + b"\n")
 
-        # Check that CSS classes are defined
-        assert ".bash-input" in html, "Bash input CSS should be defined"
-        assert ".bash-prompt" in html, "Bash prompt CSS should be defined"
-        assert ".bash-command" in html, "Bash command CSS should be defined"
-        assert ".bash-output" in html, "Bash output CSS should be defined"
-        assert ".bash-stdout" in html, "Bash stdout CSS should be defined"
-        assert ".bash-stderr" in html, "Bash stderr CSS should be defined"
-        assert ".bash-empty" in html, "Bash empty CSS should be defined"
+    messages = load_transcript(test_file_path)
+    html = generate_html(messages, "Bash CSS Test")
 
-    finally:
-        test_file_path.unlink()
+    # Check that CSS classes are defined
+    assert ".bash-input" in html, "Bash input CSS should be defined"
+    assert ".bash-prompt" in html, "Bash prompt CSS should be defined"
+    assert ".bash-command" in html, "Bash command CSS should be defined"
+    assert ".bash-output" in html, "Bash output CSS should be defined"
+    assert ".bash-stdout" in html, "Bash stdout CSS should be defined"
+    assert ".bash-stderr" in html, "Bash stderr CSS should be defined"
+    assert ".bash-empty" in html, "Bash empty CSS should be defined"
 
 
 if __name__ == "__main__":
-    # Run all tests
-    test_bash_input_rendering()
-    test_bash_stdout_rendering()
-    test_bash_stderr_rendering()
-    test_bash_empty_output_rendering()
-    test_bash_mixed_output_rendering()
-    test_bash_complex_command_rendering()
-    test_bash_multiline_output_rendering()
-    test_bash_ansi_color_rendering()
-    test_bash_tool_result_ansi_processing()
-    test_bash_tool_result_cursor_stripping()
-    test_bash_css_styles_included()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Run all tests
+        test_bash_input_rendering(Path(tmp_dir))
+        test_bash_stdout_rendering(Path(tmp_dir))
+        test_bash_stderr_rendering(Path(tmp_dir))
+        test_bash_empty_output_rendering(Path(tmp_dir))
+        test_bash_mixed_output_rendering(Path(tmp_dir))
+        test_bash_complex_command_rendering(Path(tmp_dir))
+        test_bash_multiline_output_rendering(Path(tmp_dir))
+        test_bash_ansi_color_rendering(Path(tmp_dir))
+        test_bash_tool_result_ansi_processing()
+        test_bash_tool_result_cursor_stripping()
+        test_bash_css_styles_included(Path(tmp_dir))
     print("✅ All bash rendering tests passed!")
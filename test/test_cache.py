@@ -362,6 +362,17 @@ class TestLibraryVersion:
         assert isinstance(version, str)
         assert len(version) > 0
 
+    def test_get_library_version_looks_up_metadata_once(self):
+        """Test that repeated version lookups don't re-read package metadata."""
+        get_library_version.cache_clear()
+        try:
+            with patch("importlib.metadata.version", return_value="9.9.9") as version:
+                assert get_library_version() == "9.9.9"
+                assert get_library_version() == "9.9.9"
+            version.assert_called_once_with("claude-code-log")
+        finally:
+            get_library_version.cache_clear()
+
     def test_version_fallback_without_toml(self):
         """Test version fallback when toml module not available."""
         # Mock the import statement to fail
@@ -376,6 +387,7 @@ class TestLibraryVersion:
 
             # Mock the import to raise ImportError
             with patch.dict("sys.modules", {"toml": None}):
+                get_library_version.cache_clear()
                 version = get_library_version()
                 # Should still return a version using manual parsing
                 assert isinstance(version, str)
@@ -383,6 +395,7 @@ class TestLibraryVersion:
         finally:
             # Restore original modules
             sys.modules.update(original_modules)
+            get_library_version.cache_clear()
 
 
 class TestCacheVersionCompatibility:
@@ -7,6 +7,7 @@ from pathlib import Path
 from unittest.mock import patch
 from datetime import datetime
 
+import orjson
 import pytest
 from click.testing import CliRunner
 
@@ -76,9 +77,9 @@ def setup_test_project(temp_projects_dir, sample_jsonl_data):
 
     # Create JSONL file
     jsonl_file = project_dir / "session-1.jsonl"
-    with open(jsonl_file, "w") as f:
-        for entry in sample_jsonl_data:
-            f.write(json.dumps(entry) + "\n")
+    jsonl_file.write_bytes(
+        b"".join(orjson.dumps(entry) + b"\n" for entry in sample_jsonl_data)
+    )
 
     return project_dir
 
@@ -143,13 +144,13 @@ class TestCacheIntegrationCLI:
             project_dir.mkdir()
 
             jsonl_file = project_dir / f"session-{i}.jsonl"
-            with open(jsonl_file, "w") as f:
+            with open(jsonl_file, "wb") as f:
                 for entry in sample_jsonl_data:
                     # Modify session ID for each project
                     entry_copy = entry.copy()
                     if "sessionId" in entry_copy:
                         entry_copy["sessionId"] = f"session-{i}"
-                    f.write(json.dumps(entry_copy) + "\n")
+                    f.write(orjson.dumps(entry_copy) + b"\n")
 
         runner = CliRunner()
 
@@ -229,12 +230,12 @@ class TestCacheIntegrationConverter:
             project_dir.mkdir()
 
             jsonl_file = project_dir / f"session-{i}.jsonl"
-            with open(jsonl_file, "w") as f:
+            with open(jsonl_file, "wb") as f:
                 for entry in sample_jsonl_data:
                     entry_copy = entry.copy()
                     if "sessionId" in entry_copy:
                         entry_copy["sessionId"] = f"session-{i}"
-                    f.write(json.dumps(entry_copy) + "\n")
+                    f.write(orjson.dumps(entry_copy) + b"\n")
 
         # First processing (populate cache)
         output1 = process_projects_hierarchy(
@@ -306,9 +307,9 @@ class TestCachePerformanceIntegration:
             )
 
         jsonl_file = project_dir / "large-session.jsonl"
-        with open(jsonl_file, "w") as f:
-            for entry in large_jsonl_data:
-                f.write(json.dumps(entry) + "\n")
+        jsonl_file.write_bytes(
+            b"".join(orjson.dumps(entry) + b"\n" for entry in large_jsonl_data)
+        )
 
         import time
 
@@ -355,22 +356,22 @@ class TestCacheEdgeCases:
 
         # Create first file and process it (will be cached)
         file1 = project_dir / "session-1.jsonl"
-        with open(file1, "w") as f:
-            for entry in sample_jsonl_data:
-                f.write(json.dumps(entry) + "\n")
+        file1.write_bytes(
+            b"".join(orjson.dumps(entry) + b"\n" for entry in sample_jsonl_data)
+        )
 
         convert_jsonl_to_html(input_path=project_dir, use_cache=True)
 
         # Add second file (will not be cached initially)
         file2 = project_dir / "session-2.jsonl"
-        with open(file2, "w") as f:
+        with open(file2, "wb") as f:
             for entry in sample_jsonl_data:
                 entry_copy = entry.copy()
                 if "sessionId" in entry_copy:
                     entry_copy["sessionId"] = "session-2"
                 if "uuid" in entry_copy:
                     entry_copy["uuid"] = entry_copy["uuid"].replace("1", "2")
-                f.write(json.dumps(entry_copy) + "\n")
+                f.write(orjson.dumps(entry_copy) + b"\n")
 
         # Process again (should handle mixed cache state)
         output = convert_jsonl_to_html(input_path=project_dir, use_cache=True)
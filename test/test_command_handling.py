@@ -1,13 +1,8 @@
 #!/usr/bin/env python3
 """Test cases for command message handling and parsing."""
 
-import json
-import tempfile
-from pathlib import Path
-from claude_code_log.converter import (
-    load_transcript,
-    generate_html,
-)
+from claude_code_log.converter import load_transcript
+from claude_code_log.renderer import generate_html
 
 
 def test_system_message_command_handling():
@@ -37,36 +32,27 @@ def test_system_message_command_handling():
     # (We can't test extraction directly on raw dicts because they need to be parsed first)
 
     # Test HTML generation
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write(json.dumps(command_message) + "\n")
-        f.flush()
-        test_file_path = Path(f.name)
+    messages = load_transcript([command_message])
+    html = generate_html(messages, "Test Transcript")
 
-    try:
-        messages = load_transcript(test_file_path)
-        html = generate_html(messages, "Test Transcript")
-
-        # Check if content is long enough for collapsible details or short content format
-        if len('{"type": "text", "text": "Please analyze this codebase..."}') > 200:
-            assert 'class="collapsible-details"' in html, (
-                "Should contain collapsible details element for long content"
-            )
-        else:
-            # For short content, should have details-content div but not collapsible-details class
-            assert "details-content" in html, (
-                "Should contain details-content div for short content"
-            )
-        assert "<strong>Command:</strong> init" in html, (
-            "Should show command name in summary"
+    # Check if content is long enough for collapsible details or short content format
+    if len('{"type": "text", "text": "Please analyze this codebase..."}') > 200:
+        assert 'class="collapsible-details"' in html, (
+            "Should contain collapsible details element for long content"
         )
-        assert "class='message system'" in html, "Should have system CSS class"
-
-        print(
-            "✓ Test passed: System messages with commands are shown in expandable details"
+    else:
+        # For short content, should have details-content div but not collapsible-details class
+        assert "details-content" in html, (
+            "Should contain details-content div for short content"
         )
-
-    finally:
-        test_file_path.unlink()
+    assert "<strong>Command:</strong> init" in html, (
+        "Should show command name in summary"
+    )
+    assert "class='message system'" in html, "Should have system CSS class"
+
+    print(
+        "✓ Test passed: System messages with commands are shown in expandable details"
+    )
 
 
 if __name__ == "__main__":
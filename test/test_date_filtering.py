@@ -1,12 +1,19 @@
 #!/usr/bin/env python3
 """Test cases for date filtering functionality."""
 
-import json
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import List, Optional
+
+import orjson
+import pytest
+
 from claude_code_log.converter import filter_messages_by_date, convert_jsonl_to_html
-from claude_code_log.models import parse_transcript_entry
+from claude_code_log.models import TranscriptEntry, parse_transcript_entry
+
+# Fixed transcript timestamp format, avoiding isoformat() + "Z" concatenation
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
 
 
 def create_test_message(timestamp_str: str, text: str) -> dict:
@@ -25,128 +32,118 @@ def create_test_message(timestamp_str: str, text: str) -> dict:
     }
 
 
-def test_date_filtering():
-    """Test filtering messages by date range."""
-
-    # Create test messages with different timestamps
-    today = datetime.now()
-    yesterday = today - timedelta(days=1)
-    two_days_ago = today - timedelta(days=2)
-    three_days_ago = today - timedelta(days=3)
-
+@pytest.fixture(scope="module")
+def dated_messages() -> List[TranscriptEntry]:
+    """Messages from today and each of the previous three days."""
+    now = datetime.now()
     message_dicts = [
         create_test_message(
-            three_days_ago.isoformat() + "Z", "Message from 3 days ago"
-        ),
-        create_test_message(two_days_ago.isoformat() + "Z", "Message from 2 days ago"),
-        create_test_message(yesterday.isoformat() + "Z", "Message from yesterday"),
-        create_test_message(today.isoformat() + "Z", "Message from today"),
+            (now - timedelta(days=days_ago)).strftime(TIMESTAMP_FORMAT), text
+        )
+        for days_ago, text in [
+            (3, "Message from 3 days ago"),
+            (2, "Message from 2 days ago"),
+            (1, "Message from yesterday"),
+            (0, "Message from today"),
+        ]
     ]
 
     # Parse dictionaries into TranscriptEntry objects
-    messages = [parse_transcript_entry(msg_dict) for msg_dict in message_dicts]
-
-    # Test filtering from yesterday onwards
-    filtered = filter_messages_by_date(messages, "yesterday", None)
-    assert len(filtered) == 2, (
-        f"Expected 2 messages from yesterday onwards, got {len(filtered)}"
-    )
-
-    # Test filtering up to yesterday
-    filtered = filter_messages_by_date(messages, None, "yesterday")
-    assert len(filtered) >= 2, (
-        f"Expected at least 2 messages up to yesterday, got {len(filtered)}"
-    )
-
-    # Test filtering for today only
-    filtered = filter_messages_by_date(messages, "today", "today")
-    assert len(filtered) == 1, f"Expected 1 message for today only, got {len(filtered)}"
-    assert "Message from today" in str(filtered[0])
-
-    # Test no filtering
-    filtered = filter_messages_by_date(messages, None, None)
-    assert len(filtered) == 4, (
-        f"Expected all 4 messages when no filtering, got {len(filtered)}"
+    return [parse_transcript_entry(msg_dict) for msg_dict in message_dicts]
+
+
+@pytest.mark.parametrize(
+    "from_date,to_date,expected_texts",
+    [
+        ("yesterday", None, ["Message from yesterday", "Message from today"]),
+        (
+            None,
+            "yesterday",
+            [
+                "Message from 3 days ago",
+                "Message from 2 days ago",
+                "Message from yesterday",
+            ],
+        ),
+        ("today", "today", ["Message from today"]),
+        (
+            None,
+            None,
+            [
+                "Message from 3 days ago",
+                "Message from 2 days ago",
+                "Message from yesterday",
+                "Message from today",
+            ],
+        ),
+    ],
+    ids=["from_yesterday", "to_yesterday", "today_only", "no_filter"],
+)
+def test_date_filtering(
+    dated_messages: List[TranscriptEntry],
+    from_date: Optional[str],
+    to_date: Optional[str],
+    expected_texts: List[str],
+):
+    """Test filtering messages by date range."""
+    filtered = filter_messages_by_date(dated_messages, from_date, to_date)
+    assert len(filtered) == len(expected_texts), (
+        f"Expected {len(expected_texts)} messages, got {len(filtered)}"
     )
-
-    print("✓ Test passed: Date filtering works correctly")
+    for message, expected_text in zip(filtered, expected_texts):
+        assert expected_text in str(message)
 
 
 def test_invalid_date_handling():
     """Test handling of invalid date strings."""
     messages = [create_test_message("2025-06-08T12:00:00Z", "Test message")]
 
-    try:
+    with pytest.raises(ValueError, match="Could not parse from-date"):
         filter_messages_by_date(messages, "invalid-date", None)
-        assert False, "Should have raised ValueError for invalid date"
-    except ValueError as e:
-        assert "Could not parse from-date" in str(e)
-        print("✓ Test passed: Invalid from-date raises ValueError")
 
-    try:
+    with pytest.raises(ValueError, match="Could not parse to-date"):
         filter_messages_by_date(messages, None, "another-invalid-date")
-        assert False, "Should have raised ValueError for invalid date"
-    except ValueError as e:
-        assert "Could not parse to-date" in str(e)
-        print("✓ Test passed: Invalid to-date raises ValueError")
 
 
-def test_end_to_end_date_filtering():
+def test_end_to_end_date_filtering(tmp_path):
     """Test end-to-end date filtering with JSONL file."""
 
     # Create test messages
-    today = datetime.now()
-    yesterday = today - timedelta(days=1)
+    now = datetime.now()
+    yesterday = now - timedelta(days=1)
 
     messages = [
-        create_test_message(yesterday.isoformat() + "Z", "Yesterday's message"),
-        create_test_message(today.isoformat() + "Z", "Today's message"),
+        create_test_message(
+            yesterday.strftime(TIMESTAMP_FORMAT), "Yesterday's message"
+        ),
+        create_test_message(now.strftime(TIMESTAMP_FORMAT), "Today's message"),
     ]
 
-    # Write to temporary JSONL file
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".jsonl", delete=False, encoding="utf-8"
-    ) as f:
-        for msg in messages:
-            f.write(json.dumps(msg) + "\n")
-        f.flush()
-        test_file_path = Path(f.name)
-
-    try:
-        # Test conversion with date filtering
-        with tempfile.NamedTemporaryFile(suffix=".html", delete=False) as output_f:
-            output_path = Path(output_f.name)
-
-        # Filter for today only
-        result_path = convert_jsonl_to_html(
-            test_file_path, output_path, "today", "today"
-        )
+    # Write to JSONL file
+    test_file_path = tmp_path / "test.jsonl"
+    test_file_path.write_bytes(b"".join(orjson.dumps(msg) + b"\n" for msg in messages))
+    output_path = tmp_path / "test.html"
 
-        # Check the generated HTML
-        html_content = result_path.read_text(encoding="utf-8")
+    # Filter for today only
+    result_path = convert_jsonl_to_html(test_file_path, output_path, "today", "today")
 
-        # Should contain today's message (HTML escaped)
-        assert "Today&#x27;s message" in html_content, (
-            "HTML should contain today's message"
-        )
+    # Check the generated HTML (raw bytes, as only substring checks are needed)
+    html_bytes = result_path.read_bytes()
 
-        # Should NOT contain yesterday's message
-        assert "Yesterday&#x27;s message" not in html_content, (
-            "HTML should not contain yesterday's message"
-        )
+    # Should contain today's message (HTML escaped)
+    assert b"Today&#x27;s message" in html_bytes, "HTML should contain today's message"
 
-        # Should include date range in title
-        assert "from today" in html_content and "to today" in html_content, (
-            "HTML title should include date range"
-        )
+    # Should NOT contain yesterday's message
+    assert b"Yesterday&#x27;s message" not in html_bytes, (
+        "HTML should not contain yesterday's message"
+    )
 
-        print("✓ Test passed: End-to-end date filtering works")
+    # Should include date range in title
+    assert b"from today" in html_bytes and b"to today" in html_bytes, (
+        "HTML title should include date range"
+    )
 
-    finally:
-        # Clean up
-        test_file_path.unlink()
-        if output_path.exists():
-            output_path.unlink()
+    print("✓ Test passed: End-to-end date filtering works")
 
 
 def test_natural_language_dates():
@@ -168,8 +165,8 @@ def test_natural_language_dates():
 
 
 if __name__ == "__main__":
-    test_date_filtering()
     test_invalid_date_handling()
-    test_end_to_end_date_filtering()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        test_end_to_end_date_filtering(Path(tmp_dir))
     test_natural_language_dates()
     print("\n✓ All date filtering tests passed!")
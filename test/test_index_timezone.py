@@ -3,33 +3,53 @@
 import pytest
 from pathlib import Path
 
-
-@pytest.mark.browser
-def test_index_timezone_conversion(page):
-    """Test that timestamps are converted to local timezone in index page."""
-    # Generate index page
+pytestmark = pytest.mark.browser
+
+# Read the first matching timestamp's text and attributes in one round-trip
+_FIRST_TIMESTAMP_JS = """(selector) => {
+    const el = document.querySelector(selector);
+    return el && {
+        text: el.innerText,
+        title: el.getAttribute("title"),
+        end: el.getAttribute("data-timestamp-end"),
+    };
+}"""
+
+
+@pytest.fixture(scope="session")
+def index_path() -> Path:
+    """Generated projects index, skipping when it hasn't been generated."""
     index_path = Path.home() / ".claude" / "projects" / "index.html"
-
     if not index_path.exists():
         pytest.skip("Index file not found")  # type: ignore[call-non-callable]
+    return index_path
+
+
+@pytest.fixture(scope="session")
+def test_html_path() -> Path:
+    """Transcript rendered from test data, skipping when it doesn't exist."""
+    test_html_path = Path("/tmp/test_output_tz.html")
+    if not test_html_path.exists():
+        pytest.skip("Test HTML file not found")  # type: ignore[call-non-callable]
+    return test_html_path
 
+
+def test_index_timezone_conversion(index_path, page):
+    """Test that timestamps are converted to local timezone in index page."""
     # Load the page
     page.goto(f"file://{index_path}")
 
     # Wait for DOM to be ready
     page.wait_for_load_state("domcontentloaded")
 
-    # Check if there are any timestamp elements with data-timestamp attribute
-    timestamp_elements = page.query_selector_all(".timestamp[data-timestamp]")
+    # Get the first timestamp element with data-timestamp attribute
+    first_timestamp = page.evaluate(_FIRST_TIMESTAMP_JS, ".timestamp[data-timestamp]")
 
-    if len(timestamp_elements) == 0:
+    if first_timestamp is None:
         pytest.skip("No timestamps found in index page")  # type: ignore[call-non-callable]
 
-    # Get the first timestamp element
-    first_timestamp = timestamp_elements[0]
-
     # Check that the timestamp has been converted (should contain timezone info)
-    timestamp_text = first_timestamp.inner_text()
+    timestamp_text = first_timestamp["text"]
 
     # Should contain either a timezone abbreviation or "(UTC)"
     assert "(" in timestamp_text and ")" in timestamp_text, (
@@ -37,7 +57,7 @@ def test_index_timezone_conversion(page):
     )
 
     # Check that the title attribute contains UTC and local time info
-    title = first_timestamp.get_attribute("title")
+    title = first_timestamp["title"]
     assert title is not None, "Timestamp should have a title attribute"
     assert "UTC:" in title, f"Title should contain UTC time: {title}"
 
@@ -47,7 +67,7 @@ def test_index_timezone_conversion(page):
     )
 
     # If there's a time range, check it's formatted correctly
-    if first_timestamp.get_attribute("data-timestamp-end"):
+    if first_timestamp["end"]:
         # Should have " to " in the middle
         assert " to " in timestamp_text, (
             f"Time range should contain ' to ': {timestamp_text}"
@@ -61,32 +81,23 @@ def test_index_timezone_conversion(page):
     print("✓ No comma in timestamp format")
 
 
-@pytest.mark.browser
-def test_session_navigation_timezone_conversion(page):
+def test_session_navigation_timezone_conversion(test_html_path, page):
     """Test that session navigation timestamps are converted to local timezone."""
-    # Use test data file
-    test_html_path = Path("/tmp/test_output_tz.html")
-
-    if not test_html_path.exists():
-        pytest.skip("Test HTML file not found")  # type: ignore[call-non-callable]
-
     # Load the page
     page.goto(f"file://{test_html_path}")
 
     # Wait for DOM to be ready
     page.wait_for_load_state("domcontentloaded")
 
-    # Find session navigation timestamps
-    session_timestamps = page.query_selector_all(
-        ".session-link-meta .timestamp[data-timestamp]"
+    # Get the first session navigation timestamp
+    first_session_ts = page.evaluate(
+        _FIRST_TIMESTAMP_JS, ".session-link-meta .timestamp[data-timestamp]"
     )
 
-    if len(session_timestamps) == 0:
+    if first_session_ts is None:
         pytest.skip("No session navigation timestamps found")  # type: ignore[call-non-callable]
 
-    # Get the first session timestamp
-    first_session_ts = session_timestamps[0]
-    session_text = first_session_ts.inner_text()
+    session_text = first_session_ts["text"]
 
     # Check that it has timezone info
     assert "(" in session_text and ")" in session_text, (
@@ -99,7 +110,7 @@ def test_session_navigation_timezone_conversion(page):
     )
 
     # Check title attribute
-    title = first_session_ts.get_attribute("title")
+    title = first_session_ts["title"]
     assert title is not None, "Session timestamp should have title"
     assert "UTC:" in title, f"Title should contain UTC: {title}"
 
@@ -1,13 +1,10 @@
 #!/usr/bin/env python3
 """Test cases for server-side markdown rendering."""
 
+import io
 import json
-import tempfile
-from pathlib import Path
-from claude_code_log.converter import (
-    load_transcript,
-    generate_html,
-)
+from claude_code_log.converter import load_transcript
+from claude_code_log.renderer import generate_html
 
 
 def test_server_side_markdown_rendering():
@@ -40,34 +37,23 @@ def test_server_side_markdown_rendering():
         },
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write(json.dumps(assistant_message) + "\n")
-        f.flush()
-        test_file_path = Path(f.name)
+    messages = load_transcript(io.StringIO(json.dumps(assistant_message) + "\n"))
+    html = generate_html(messages, "Test Transcript")
 
-    try:
-        messages = load_transcript(test_file_path)
-        html = generate_html(messages, "Test Transcript")
+    # Should NOT include marked.js script references
+    assert "marked" not in html, "Should not include marked.js reference"
+    assert "import { marked }" not in html, "Should not import marked module"
+    assert "marked.parse" not in html, "Should not use marked.parse function"
+    assert "DOMContentLoaded" not in html or "marked" not in html, (
+        "Should not have markdown-related DOM handlers"
+    )
 
-        # Should NOT include marked.js script references
-        assert "marked" not in html, "Should not include marked.js reference"
-        assert "import { marked }" not in html, "Should not import marked module"
-        assert "marked.parse" not in html, "Should not use marked.parse function"
-        assert "DOMContentLoaded" not in html or "marked" not in html, (
-            "Should not have markdown-related DOM handlers"
-        )
+    # Should include rendered HTML from markdown
+    assert "<h1>Test Markdown</h1>" in html, "Should render markdown heading as HTML"
+    assert "<strong>bold</strong>" in html, "Should render bold text as HTML"
+    assert "<code>code</code>" in html, "Should render inline code as HTML"
 
-        # Should include rendered HTML from markdown
-        assert "<h1>Test Markdown</h1>" in html, (
-            "Should render markdown heading as HTML"
-        )
-        assert "<strong>bold</strong>" in html, "Should render bold text as HTML"
-        assert "<code>code</code>" in html, "Should render inline code as HTML"
-
-        print("✓ Test passed: Markdown is rendered server-side")
-
-    finally:
-        test_file_path.unlink()
+    print("✓ Test passed: Markdown is rendered server-side")
 
 
 def test_user_message_not_markdown_rendered():
@@ -93,33 +79,24 @@ def test_user_message_not_markdown_rendered():
         },
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write(json.dumps(user_message) + "\n")
-        f.flush()
-        test_file_path = Path(f.name)
-
-    try:
-        messages = load_transcript(test_file_path)
-        html = generate_html(messages, "Test Transcript")
-
-        # User messages should be shown as-is in pre tags, not rendered as HTML
-        assert "<pre># This should NOT be rendered" in html, (
-            "User markdown should remain as text in pre tags"
-        )
-        assert "**This should stay bold**</pre>" in html, (
-            "User markdown asterisks should remain literal"
-        )
-        assert "<h1>This should NOT be rendered</h1>" not in html, (
-            "User markdown should not be rendered as HTML"
-        )
-        assert "<strong>This should stay bold</strong>" not in html, (
-            "User markdown should not be rendered as HTML"
-        )
-
-        print("✓ Test passed: User messages are not markdown rendered")
-
-    finally:
-        test_file_path.unlink()
+    messages = load_transcript(io.StringIO(json.dumps(user_message) + "\n"))
+    html = generate_html(messages, "Test Transcript")
+
+    # User messages should be shown as-is in pre tags, not rendered as HTML
+    assert "<pre># This should NOT be rendered" in html, (
+        "User markdown should remain as text in pre tags"
+    )
+    assert "**This should stay bold**</pre>" in html, (
+        "User markdown asterisks should remain literal"
+    )
+    assert "<h1>This should NOT be rendered</h1>" not in html, (
+        "User markdown should not be rendered as HTML"
+    )
+    assert "<strong>This should stay bold</strong>" not in html, (
+        "User markdown should not be rendered as HTML"
+    )
+
+    print("✓ Test passed: User messages are not markdown rendered")
 
 
 if __name__ == "__main__":
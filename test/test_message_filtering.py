@@ -1,15 +1,15 @@
 #!/usr/bin/env python3
 """Test cases for message filtering: system messages, caveats, etc."""
 
-import json
 import tempfile
 from pathlib import Path
+import orjson
 from claude_code_log.parser import load_transcript
 from claude_code_log.renderer import generate_html
 from claude_code_log.utils import is_system_message
 
 
-def test_caveat_message_filtering():
+def test_caveat_message_filtering(tmp_path):
     """Test that caveat messages are properly filtered out."""
     # Create a test JSONL file with a caveat message
     caveat_message = {
@@ -66,38 +66,32 @@ def test_caveat_message_filtering():
     )
 
     # Test end-to-end with JSONL processing
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write(json.dumps(caveat_message) + "\n")
-        f.write(json.dumps(normal_message) + "\n")
-        f.flush()
-
-        test_file_path = Path(f.name)
-
-    try:
-        # Load the transcript
-        messages = load_transcript(test_file_path)
-        assert len(messages) == 2, f"Expected 2 messages, got {len(messages)}"
+    test_file_path = tmp_path / "test.jsonl"
+    test_file_path.write_bytes(
+        b"".join(orjson.dumps(msg) + b"\n" for msg in [caveat_message, normal_message])
+    )
 
-        # Generate HTML
-        html = generate_html(messages, "Test Transcript")
+    # Load the transcript
+    messages = load_transcript(test_file_path)
+    assert len(messages) == 2, f"Expected 2 messages, got {len(messages)}"
 
-        # The HTML should NOT contain the caveat message
-        assert "Caveat: The messages below were generated" not in html, (
-            "Caveat message should be filtered out of HTML"
-        )
+    # Generate HTML
+    html = generate_html(messages, "Test Transcript")
 
-        # The HTML should contain the normal message
-        assert "This is a normal user message" in html, (
-            "Normal message should appear in HTML"
-        )
+    # The HTML should NOT contain the caveat message
+    assert "Caveat: The messages below were generated" not in html, (
+        "Caveat message should be filtered out of HTML"
+    )
 
-        print("✓ Test passed: Caveat messages are properly filtered out")
+    # The HTML should contain the normal message
+    assert "This is a normal user message" in html, (
+        "Normal message should appear in HTML"
+    )
 
-    finally:
-        test_file_path.unlink()
+    print("✓ Test passed: Caveat messages are properly filtered out")
 
 
-def test_system_message_filtering():
+def test_system_message_filtering(tmp_path):
     """Test that caveat messages are filtered but command output is shown."""
     stdout_message = {
         "type": "user",
@@ -150,32 +144,28 @@ def test_system_message_filtering():
         "Caveat: The messages below were generated by the user while running local commands. DO NOT respond to these messages or otherwise consider them in your response unless the user explicitly asks you to."
     ), "caveat messages should be filtered"
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write(json.dumps(stdout_message) + "\n")
-        f.write(json.dumps(caveat_message) + "\n")
-        f.flush()
-        test_file_path = Path(f.name)
-
-    try:
-        messages = load_transcript(test_file_path)
-        html = generate_html(messages, "Test Transcript")
+    test_file_path = tmp_path / "test.jsonl"
+    test_file_path.write_bytes(
+        b"".join(orjson.dumps(msg) + b"\n" for msg in [stdout_message, caveat_message])
+    )
 
-        # Command output should now appear in HTML (rendered as "Command Output:")
-        assert "Command Output:" in html or "Some command output here" in html, (
-            "stdout messages should now be rendered"
-        )
-        # But caveat messages should still be filtered out
-        assert "Caveat: The messages below" not in html, (
-            "caveat messages should be filtered out"
-        )
+    messages = load_transcript(test_file_path)
+    html = generate_html(messages, "Test Transcript")
 
-        print("✓ Test passed: Other system messages are still filtered out")
+    # Command output should now appear in HTML (rendered as "Command Output:")
+    assert "Command Output:" in html or "Some command output here" in html, (
+        "stdout messages should now be rendered"
+    )
+    # But caveat messages should still be filtered out
+    assert "Caveat: The messages below" not in html, (
+        "caveat messages should be filtered out"
+    )
 
-    finally:
-        test_file_path.unlink()
+    print("✓ Test passed: Other system messages are still filtered out")
 
 
 if __name__ == "__main__":
-    test_caveat_message_filtering()
-    test_system_message_filtering()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        test_caveat_message_filtering(Path(tmp_dir))
+        test_system_message_filtering(Path(tmp_dir))
     print("\n✅ All message filtering tests passed!")
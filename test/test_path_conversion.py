@@ -34,5 +34,36 @@ def test_path_conversion():
     print()
 
 
+def test_path_conversion_cache_follows_cwd(tmp_path, monkeypatch):
+    """Test that cached conversions still resolve relative paths against the cwd."""
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    monkeypatch.chdir(first)
+    assert convert_project_path_to_claude_dir(Path(".")).name.endswith("-first")
+    assert convert_project_path_to_claude_dir(Path(".")).name.endswith("-first")
+
+    monkeypatch.chdir(second)
+    assert convert_project_path_to_claude_dir(Path(".")).name.endswith("-second")
+
+
+def test_path_conversion_follows_retargeted_symlink(tmp_path):
+    """Test that conversions pick up a symlink pointing somewhere new."""
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    link = tmp_path / "link"
+
+    link.symlink_to(first)
+    assert convert_project_path_to_claude_dir(link).name.endswith("-first")
+
+    link.unlink()
+    link.symlink_to(second)
+    assert convert_project_path_to_claude_dir(link).name.endswith("-second")
+
+
 if __name__ == "__main__":
     test_path_conversion()
@@ -1,102 +1,76 @@
 """Playwright-based tests for query parameter functionality in the browser."""
 
-import tempfile
 import re
 from pathlib import Path
 from typing import List
 import pytest
 from playwright.sync_api import Page, expect
 
-from claude_code_log.parser import load_transcript
-from claude_code_log.renderer import generate_html
-from claude_code_log.models import TranscriptEntry
+# Matches the "active" class token on filter buttons and toggles
+_ACTIVE_RE = re.compile(r"\bactive\b")
 
 
 class TestQueryParamsBrowser:
     """Test query parameter functionality using Playwright in a real browser."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_files: List[Path] = []
-
-    def teardown_method(self):
-        """Clean up temporary files."""
-        for temp_file in self.temp_files:
-            try:
-                temp_file.unlink()
-            except FileNotFoundError:
-                pass
-
-    def _create_temp_html(self, messages: List[TranscriptEntry], title: str) -> Path:
-        """Create a temporary HTML file for testing."""
-        html_content = generate_html(messages, title)
-
-        # Create temporary file securely
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".html", delete=False, encoding="utf-8"
-        ) as f:
-            f.write(html_content)
-            temp_file = Path(f.name)
-        self.temp_files.append(temp_file)
-
-        return temp_file
-
     @pytest.mark.browser
-    def test_filter_query_param_shows_toolbar(self, page: Page):
-        """Test that filter query parameter makes toolbar visible."""
-        sidechain_file = Path("test/test_data/sidechain.jsonl")
-        messages = load_transcript(sidechain_file)
-        temp_file = self._create_temp_html(messages, "Query Param Test")
-
-        # Load page with filter query param
-        page.goto(f"file://{temp_file}?filter=user,assistant")
+    @pytest.mark.parametrize(
+        "query,toolbar_visible,active_types,inactive_types",
+        [
+            (
+                "?filter=user,assistant",
+                True,
+                ["user", "assistant"],
+                ["system", "sidechain"],
+            ),
+            ("?filter=user,invalid_type,assistant", True, ["user", "assistant"], []),
+            ("", False, [], []),
+        ],
+        ids=["user_assistant", "invalid_type_ignored", "no_query_params"],
+    )
+    def test_query_params_toolbar_and_toggles(
+        self,
+        page: Page,
+        sidechain_html_path: Path,
+        query: str,
+        toolbar_visible: bool,
+        active_types: List[str],
+        inactive_types: List[str],
+    ):
+        """Test that the filter query parameter sets toolbar visibility and toggles.
+
+        Invalid filter types are ignored, and without query params the toolbar
+        stays hidden.
+        """
+        page.goto(f"file://{sidechain_html_path}{query}")
 
-        # Filter toolbar should be visible
         filter_toolbar = page.locator(".filter-toolbar")
-        expect(filter_toolbar).to_be_visible()
-
-        # Filter button should have active class
-        filter_button = page.locator("#filterMessages")
-        expect(filter_button).to_have_class(re.compile(r".*active.*"))
-
-    @pytest.mark.browser
-    def test_filter_query_param_sets_active_toggles(self, page: Page):
-        """Test that filter query parameter activates only specified message types."""
-        sidechain_file = Path("test/test_data/sidechain.jsonl")
-        messages = load_transcript(sidechain_file)
-        temp_file = self._create_temp_html(messages, "Query Param Toggle Test")
-
-        # Load page with only user and assistant filters
-        page.goto(f"file://{temp_file}?filter=user,assistant")
-
-        # User and assistant toggles should be active
-        user_toggle = page.locator('[data-type="user"]')
-        assistant_toggle = page.locator('[data-type="assistant"]')
-        expect(user_toggle).to_have_class(re.compile(r".*active.*"))
-        expect(assistant_toggle).to_have_class(re.compile(r".*active.*"))
-
-        # Other toggles should not be active
-        system_toggle = page.locator('[data-type="system"]')
-        if system_toggle.count() > 0:
-            expect(system_toggle).not_to_have_class(re.compile(r".*active.*"))
-
-        sidechain_toggle = page.locator('[data-type="sidechain"]')
-        if sidechain_toggle.count() > 0:
-            expect(sidechain_toggle).not_to_have_class(re.compile(r".*active.*"))
+        if toolbar_visible:
+            expect(filter_toolbar).to_be_visible()
+            # Filter button should have active class
+            expect(page.locator("#filterMessages")).to_have_class(_ACTIVE_RE)
+        else:
+            expect(filter_toolbar).not_to_be_visible()
+
+        for message_type in active_types:
+            expect(page.locator(f'[data-type="{message_type}"]')).to_have_class(
+                _ACTIVE_RE
+            )
+
+        for message_type in inactive_types:
+            toggle = page.locator(f'[data-type="{message_type}"]')
+            if toggle.count() > 0:
+                expect(toggle).not_to_have_class(_ACTIVE_RE)
 
     @pytest.mark.browser
-    def test_filter_query_param_filters_messages(self, page: Page):
+    def test_filter_query_param_filters_messages(
+        self, page: Page, sidechain_html_path: Path
+    ):
         """Test that filter query parameter actually hides/shows messages."""
-        sidechain_file = Path("test/test_data/sidechain.jsonl")
-        messages = load_transcript(sidechain_file)
-        temp_file = self._create_temp_html(messages, "Query Param Filtering Test")
-
         # Load page with user and sidechain filters active
         # (sidechain messages require both sidechain AND their type filter)
-        page.goto(f"file://{temp_file}?filter=user,sidechain")
+        page.goto(f"file://{sidechain_html_path}?filter=user,sidechain")
 
-        # Wait for page to load and filters to apply
-        page.wait_for_load_state("networkidle")
         # Wait for filter application by checking for filtered-hidden class to be applied
         page.wait_for_selector(
             ".message.assistant.filtered-hidden", state="attached", timeout=5000
@@ -115,20 +89,12 @@ class TestQueryParamsBrowser:
         assert assistant_count == 0, "Assistant messages should be hidden"
 
     @pytest.mark.browser
-    def test_no_query_params_toolbar_hidden(self, page: Page):
-        """Test that toolbar is hidden by default when no query params."""
-        sidechain_file = Path("test/test_data/sidechain.jsonl")
-        messages = load_transcript(sidechain_file)
-        temp_file = self._create_temp_html(messages, "No Query Params Test")
-
-        # Load page without query params
-        page.goto(f"file://{temp_file}")
+    def test_no_query_params_shows_all_messages(
+        self, page: Page, sidechain_html_path: Path
+    ):
+        """Test that all messages are visible by default when no query params."""
+        page.goto(f"file://{sidechain_html_path}")
 
-        # Filter toolbar should not be visible
-        filter_toolbar = page.locator(".filter-toolbar")
-        expect(filter_toolbar).not_to_be_visible()
-
-        # All messages should be visible by default
         all_messages = page.locator(".message:not(.session-header)")
         visible_messages = page.locator(
             ".message:not(.session-header):not(.filtered-hidden)"
@@ -139,35 +105,11 @@ class TestQueryParamsBrowser:
         )
 
     @pytest.mark.browser
-    def test_invalid_filter_types_ignored(self, page: Page):
-        """Test that invalid filter types are ignored gracefully."""
-        sidechain_file = Path("test/test_data/sidechain.jsonl")
-        messages = load_transcript(sidechain_file)
-        temp_file = self._create_temp_html(messages, "Invalid Filter Test")
-
-        # Load page with mix of valid and invalid filter types
-        page.goto(f"file://{temp_file}?filter=user,invalid_type,assistant")
-
-        # Filter toolbar should still be visible
-        filter_toolbar = page.locator(".filter-toolbar")
-        expect(filter_toolbar).to_be_visible()
-
-        # Valid toggles should be active
-        user_toggle = page.locator('[data-type="user"]')
-        assistant_toggle = page.locator('[data-type="assistant"]')
-        expect(user_toggle).to_have_class(re.compile(r".*active.*"))
-        expect(assistant_toggle).to_have_class(re.compile(r".*active.*"))
-
-    @pytest.mark.browser
-    def test_query_params_with_timeline(self, page: Page):
+    def test_query_params_with_timeline(self, page: Page, sidechain_html_path: Path):
         """Test that query parameters work correctly with timeline enabled."""
-        sidechain_file = Path("test/test_data/sidechain.jsonl")
-        messages = load_transcript(sidechain_file)
-        temp_file = self._create_temp_html(messages, "Query Params Timeline Test")
-
         # Load page with filter query param including sidechain
         # (sidechain messages require both sidechain AND their type filter)
-        page.goto(f"file://{temp_file}?filter=user,assistant,sidechain")
+        page.goto(f"file://{sidechain_html_path}?filter=user,assistant,sidechain")
 
         # Filter toolbar should be visible
         filter_toolbar = page.locator(".filter-toolbar")
@@ -181,10 +123,9 @@ class TestQueryParamsBrowser:
         user_toggle = page.locator('[data-type="user"]')
         assistant_toggle = page.locator('[data-type="assistant"]')
         sidechain_toggle = page.locator('[data-type="sidechain"]')
-        expect(user_toggle).to_have_class(re.compile(r".*active.*"))
-        expect(assistant_toggle).to_have_class(re.compile(r".*active.*"))
-        expect(sidechain_toggle).to_have_class(re.compile(r".*active.*"))
+        expect(user_toggle).to_have_class(_ACTIVE_RE)
+        expect(assistant_toggle).to_have_class(_ACTIVE_RE)
+        expect(sidechain_toggle).to_have_class(_ACTIVE_RE)
 
         # Timeline should show filtered content
-        timeline_items = page.locator(".vis-item")
-        assert timeline_items.count() > 0, "Timeline should have items"
+        page.locator(".vis-item").first.wait_for(state="attached", timeout=2000)
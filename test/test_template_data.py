@@ -14,6 +14,32 @@ from claude_code_log.renderer import (
 )
 
 
+PROJECT_SUMMARIES = [
+    {
+        "name": "test-project-1",
+        "path": Path("/tmp/project1"),
+        "html_file": "test-project-1/combined_transcripts.html",
+        "jsonl_count": 3,
+        "message_count": 15,
+        "last_modified": 1700000000.0,
+    },
+    {
+        "name": "-user-workspace-my-app",
+        "path": Path("/tmp/project2"),
+        "html_file": "-user-workspace-my-app/combined_transcripts.html",
+        "jsonl_count": 2,
+        "message_count": 8,
+        "last_modified": 1700000100.0,
+    },
+]
+
+
+@pytest.fixture(scope="module")
+def projects_index_html() -> str:
+    """Projects index for PROJECT_SUMMARIES, rendered once per module."""
+    return generate_projects_index_html(PROJECT_SUMMARIES)
+
+
 class TestTemplateMessage:
     """Test TemplateMessage data structure."""
 
@@ -254,8 +280,9 @@ class TestDataWithTestFiles:
         html = generate_html(messages, "Multi Session Test")
 
         # Verify session dividers are present
-        session_divider_count = html.count("session-divider")
-        assert session_divider_count > 0, "Should have at least one session divider"
+        assert html.count("session-divider") > 0, (
+            "Should have at least one session divider"
+        )
 
         # Check that messages from different files are included
         assert len(messages) > 0
@@ -264,57 +291,40 @@ class TestDataWithTestFiles:
         assert "<!DOCTYPE html>" in html
         assert "Multi Session Test" in html
 
-    def test_empty_directory_handling(self):
+    def test_empty_directory_handling(self, tmp_path):
         """Test handling of directories with no JSONL files."""
-        import tempfile
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        # Should return empty list for directory with no JSONL files
+        messages = load_directory_transcripts(tmp_path)
+        assert messages == []
 
-            # Should return empty list for directory with no JSONL files
-            messages = load_directory_transcripts(temp_path)
-            assert messages == []
-
-            # Should generate minimal HTML for empty message list
-            html = generate_html(messages, "Empty Test")
-            assert "<!DOCTYPE html>" in html
-            assert "<title>Empty Test</title>" in html
-
-    def test_projects_index_generation(self):
+        # Should generate minimal HTML for empty message list
+        html = generate_html(messages, "Empty Test")
+        assert "<!DOCTYPE html>" in html
+        assert "<title>Empty Test</title>" in html
+
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            # Basic structure
+            "<!DOCTYPE html>",
+            "<title>Claude Code Projects</title>",
+            # Both projects are listed, the second with its formatted name
+            "test-project-1",
+            "user/workspace/my/app",
+            # Per-project stats
+            "💬 15 messages",
+            "📁 3 transcript files",
+            "💬 8 messages",
+            "📁 2 transcript files",
+            # Summary stats: projects, jsonl files (3 + 2), total messages (15 + 8)
+            "<div class='number'>2</div>",
+            "<div class='number'>5</div>",
+            "<div class='number'>23</div>",
+        ],
+    )
+    def test_projects_index_generation(self, projects_index_html: str, needle: str):
         """Test generating index HTML with test project data."""
-        project_summaries = [
-            {
-                "name": "test-project-1",
-                "path": Path("/tmp/project1"),
-                "html_file": "test-project-1/combined_transcripts.html",
-                "jsonl_count": 3,
-                "message_count": 15,
-                "last_modified": 1700000000.0,
-            },
-            {
-                "name": "-user-workspace-my-app",
-                "path": Path("/tmp/project2"),
-                "html_file": "-user-workspace-my-app/combined_transcripts.html",
-                "jsonl_count": 2,
-                "message_count": 8,
-                "last_modified": 1700000100.0,
-            },
-        ]
-
-        index_html = generate_projects_index_html(project_summaries)
-
-        # Check basic structure
-        assert "<!DOCTYPE html>" in index_html
-        assert "<title>Claude Code Projects</title>" in index_html
-
-        # Check that both projects are listed
-        assert "test-project-1" in index_html
-        assert "user/workspace/my/app" in index_html  # Formatted name
-
-        # Check summary stats
-        assert "23" in index_html  # Total messages (15 + 8)
-        assert "5" in index_html  # Total jsonl files (3 + 2)
-        assert "2" in index_html  # Total projects
+        assert needle in projects_index_html
 
     def test_projects_index_with_date_range(self):
         """Test generating index HTML with date range in title."""
@@ -342,37 +352,51 @@ class TestErrorHandling:
 
     def test_malformed_message_handling(self):
         """Test that malformed messages are skipped gracefully."""
-        import tempfile
-
-        # Create a JSONL file with mix of valid and invalid entries
-        malformed_data = [
-            '{"type": "user", "timestamp": "2025-06-14T10:00:00Z", "parentUuid": null, "isSidechain": false, "userType": "human", "cwd": "/tmp", "sessionId": "test", "version": "1.0.0", "uuid": "test_000", "message": {"role": "user", "content": [{"type": "text", "text": "Valid message"}]}}',
-            '{"type": "invalid_type", "malformed": true}',  # Invalid type
-            '{"incomplete": "message"}',  # Missing required fields
-            '{"type": "user", "timestamp": "2025-06-14T10:01:00Z", "parentUuid": null, "isSidechain": false, "userType": "human", "cwd": "/tmp", "sessionId": "test", "version": "1.0.0", "uuid": "test_001", "message": {"role": "user", "content": [{"type": "text", "text": "Another valid message"}]}}',
-        ]
+        # JSONL file with a mix of valid and invalid entries
+        test_file_path = (
+            Path(__file__).parent / "test_data" / "malformed" / "malformed.jsonl"
+        )
+
+        # Should load only valid messages, skipping malformed ones
+        messages = load_transcript(test_file_path)
+
+        # Should have loaded 2 valid messages, skipped 2 malformed ones
+        assert len(messages) == 2
+
+        # Should generate HTML without errors
+        html = generate_html(messages, "Malformed Test")
+        assert "<!DOCTYPE html>" in html
+        assert "Valid message" in html
+        assert "Another valid message" in html
+
+    def test_invalid_utf8_is_replaced(self, tmp_path):
+        """Test that invalid UTF-8 bytes don't cause a message to be dropped."""
+        line = (
+            b'{"type": "user", "timestamp": "2025-06-14T10:00:00Z", "parentUuid": null, '
+            b'"isSidechain": false, "userType": "human", "cwd": "/tmp", "sessionId": "test", '
+            b'"version": "1.0.0", "uuid": "test_000", "message": {"role": "user", '
+            b'"content": [{"type": "text", "text": "Broken \xff byte"}]}}\n'
+        )
+        test_file_path = tmp_path / "invalid_utf8.jsonl"
+        test_file_path.write_bytes(line)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            for line in malformed_data:
-                f.write(line + "\n")
-            f.flush()
-            test_file_path = Path(f.name)
+        messages = load_transcript(test_file_path)
 
-        try:
-            # Should load only valid messages, skipping malformed ones
-            messages = load_transcript(test_file_path)
+        assert len(messages) == 1
+        assert "Broken \ufffd byte" in generate_html(messages, "UTF-8 Test")
 
-            # Should have loaded 2 valid messages, skipped 2 malformed ones
-            assert len(messages) == 2
+    def test_memory_mapped_loading_matches_buffered(self, monkeypatch):
+        """Test that large transcripts loaded via mmap parse the same as small ones."""
+        test_file_path = (
+            Path(__file__).parent / "test_data" / "representative_messages.jsonl"
+        )
+        buffered = load_transcript(test_file_path)
 
-            # Should generate HTML without errors
-            html = generate_html(messages, "Malformed Test")
-            assert "<!DOCTYPE html>" in html
-            assert "Valid message" in html
-            assert "Another valid message" in html
+        monkeypatch.setattr("claude_code_log.parser.TRANSCRIPT_MMAP_THRESHOLD", 0)
+        mapped = load_transcript(test_file_path)
 
-        finally:
-            test_file_path.unlink()
+        assert len(mapped) > 0
+        assert [m.model_dump() for m in mapped] == [m.model_dump() for m in buffered]
 
 
 if __name__ == "__main__":
@@ -1,30 +1,81 @@
 #!/usr/bin/env python3
 """Test cases for template rendering with representative JSONL data."""
 
-import json
-import tempfile
+import re
+import shutil
 from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterator, List
+from unittest.mock import patch
+import orjson
 import pytest
 from claude_code_log.converter import (
     convert_jsonl_to_html,
     load_transcript,
-    generate_html,
     generate_projects_index_html,
 )
+from claude_code_log import renderer
+from claude_code_log.models import TranscriptEntry
+from claude_code_log.renderer import (
+    generate_html,
+    generate_session_html,
+    write_html,
+    write_projects_index_html,
+    write_session_html,
+)
+
+
+TEST_DATA_DIR = Path(__file__).parent / "test_data"
+
+
+_CLASS_ATTR_RE = re.compile(r"""class=['"]([^'"]+)['"]""")
+
+
+def class_values(html: str) -> FrozenSet[str]:
+    """Collect every class attribute value in the HTML in a single pass."""
+    return frozenset(_CLASS_ATTR_RE.findall(html))
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink src to dst, copying instead when they are on different filesystems."""
+    try:
+        dst.hardlink_to(src)
+    except OSError:
+        shutil.copy(src, dst)
+
+
+@pytest.fixture(scope="module")
+def rendered_test_data(tmp_path_factory: pytest.TempPathFactory) -> Dict[str, str]:
+    """Test data files converted to HTML once, keyed by file stem."""
+    output_dir = tmp_path_factory.mktemp("html")
+    rendered: Dict[str, str] = {}
+    for name in ("representative_messages", "edge_cases"):
+        html_file = convert_jsonl_to_html(
+            TEST_DATA_DIR / f"{name}.jsonl", output_dir / f"{name}.html"
+        )
+        rendered[name] = html_file.read_text(encoding="utf-8")
+    return rendered
+
+
+@pytest.fixture(scope="module")
+def representative_messages() -> List[TranscriptEntry]:
+    """representative_messages.jsonl parsed once; tests must not mutate it."""
+    return load_transcript(TEST_DATA_DIR / "representative_messages.jsonl")
+
+
+@pytest.fixture(scope="module")
+def representative_generated_html(
+    representative_messages: List[TranscriptEntry],
+) -> str:
+    """HTML generated in memory from the shared representative messages."""
+    return generate_html(representative_messages)
 
 
 class TestTemplateRendering:
     """Test template rendering with various message types."""
 
-    def test_representative_messages_render(self):
+    def test_representative_messages_render(self, rendered_test_data: Dict[str, str]):
         """Test that representative messages render correctly."""
-        test_data_path = (
-            Path(__file__).parent / "test_data" / "representative_messages.jsonl"
-        )
-
-        # Convert to HTML
-        html_file = convert_jsonl_to_html(test_data_path)
-        html_content = html_file.read_text(encoding="utf-8")
+        html_content = rendered_test_data["representative_messages"]
 
         # Basic HTML structure checks
         assert "<!DOCTYPE html>" in html_content
@@ -40,8 +91,9 @@ class TestTemplateRendering:
         )
 
         # Check that all message types are present
-        assert "class='message user'" in html_content
-        assert "class='message assistant'" in html_content
+        classes = class_values(html_content)
+        assert "message user" in classes
+        assert "message assistant" in classes
         # Summary messages are now integrated into session headers
         assert "session-summary" in html_content or "Summary:" in html_content
 
@@ -62,13 +114,9 @@ class TestTemplateRendering:
         assert "<strong>" in html_content  # Bold text is rendered to strong tags
         assert "<code>" in html_content  # Inline code is rendered to code tags
 
-    def test_edge_cases_render(self):
+    def test_edge_cases_render(self, rendered_test_data: Dict[str, str]):
         """Test that edge cases render without errors."""
-        test_data_path = Path(__file__).parent / "test_data" / "edge_cases.jsonl"
-
-        # Convert to HTML
-        html_file = convert_jsonl_to_html(test_data_path)
-        html_content = html_file.read_text(encoding="utf-8")
+        html_content = rendered_test_data["edge_cases"]
 
         # Basic checks
         assert "<!DOCTYPE html>" in html_content
@@ -102,66 +150,52 @@ class TestTemplateRendering:
         assert "🎉 emojis 🚀" in html_content
         assert "∑∆√π∞" in html_content
 
-    def test_multi_session_rendering(self):
+    def test_multi_session_rendering(self, tmp_path):
         """Test multi-session rendering with proper session divider handling."""
         test_data_dir = Path(__file__).parent / "test_data"
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Copy test files to temporary directory
-            import shutil
-
-            shutil.copy(
-                test_data_dir / "representative_messages.jsonl",
-                temp_path / "session_a.jsonl",
-            )
-            shutil.copy(
-                test_data_dir / "session_b.jsonl", temp_path / "session_b.jsonl"
-            )
+        # Link test files into the temporary directory, as they are only read
+        link_or_copy(
+            test_data_dir / "representative_messages.jsonl",
+            tmp_path / "session_a.jsonl",
+        )
+        link_or_copy(test_data_dir / "session_b.jsonl", tmp_path / "session_b.jsonl")
 
-            # Convert directory to HTML
-            html_file = convert_jsonl_to_html(temp_path)
-            html_content = html_file.read_text(encoding="utf-8")
+        # Convert directory to HTML
+        html_file = convert_jsonl_to_html(tmp_path)
+        html_content = html_file.read_text(encoding="utf-8")
 
-            # Should have session headers for each session
-            session_headers = html_content.count("session-header")
-            assert session_headers >= 1, (
-                f"Expected at least 1 session header, got {session_headers}"
-            )
+        # Should have session headers for each session
+        session_headers = html_content.count("session-header")
+        assert session_headers >= 1, (
+            f"Expected at least 1 session header, got {session_headers}"
+        )
 
-            # Check both sessions' content is present
-            assert "Hello Claude! Can you help me understand" in html_content
-            assert "This is from a different session file" in html_content
-            assert "without any session divider above it" in html_content
+        # Check both sessions' content is present
+        assert "Hello Claude! Can you help me understand" in html_content
+        assert "This is from a different session file" in html_content
+        assert "without any session divider above it" in html_content
 
-    def test_empty_messages_handling(self):
+    def test_empty_messages_handling(self, tmp_path):
         """Test handling of empty or invalid messages."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            jsonl_file = temp_path / "empty_test.jsonl"
+        jsonl_file = tmp_path / "empty_test.jsonl"
 
-            # Create file with empty content
-            jsonl_file.write_text("", encoding="utf-8")
+        # Create file with empty content
+        jsonl_file.write_text("", encoding="utf-8")
 
-            # Should not crash
-            html_file = convert_jsonl_to_html(jsonl_file)
-            html_content = html_file.read_text(encoding="utf-8")
+        # Should not crash
+        html_file = convert_jsonl_to_html(jsonl_file)
+        html_content = html_file.read_text(encoding="utf-8")
 
-            assert "<!DOCTYPE html>" in html_content
-            assert "<title>Claude Transcript - empty_test</title>" in html_content
+        assert "<!DOCTYPE html>" in html_content
+        assert "<title>Claude Transcript - empty_test</title>" in html_content
 
-            # Should have no messages
-            assert "class='message" not in html_content
+        # Should have no messages
+        assert "class='message" not in html_content
 
-    def test_tool_content_rendering(self):
+    def test_tool_content_rendering(self, representative_generated_html: str):
         """Test detailed tool use and tool result rendering."""
-        test_data_path = (
-            Path(__file__).parent / "test_data" / "representative_messages.jsonl"
-        )
-
-        messages = load_transcript(test_data_path)
-        html_content = generate_html(messages)
+        html_content = representative_generated_html
 
         # Check tool use formatting
         assert "Tool Use:" in html_content
@@ -179,14 +213,9 @@ class TestTemplateRendering:
         assert "Input:" in html_content
         assert "details-content" in html_content
 
-    def test_timestamp_formatting(self):
+    def test_timestamp_formatting(self, rendered_test_data: Dict[str, str]):
         """Test that timestamps are formatted correctly."""
-        test_data_path = (
-            Path(__file__).parent / "test_data" / "representative_messages.jsonl"
-        )
-
-        html_file = convert_jsonl_to_html(test_data_path)
-        html_content = html_file.read_text(encoding="utf-8")
+        html_content = rendered_test_data["representative_messages"]
 
         # Check timestamp format (YYYY-MM-DD HH:MM:SS)
         assert "2025-07-03 15:50:07" in html_content
@@ -239,33 +268,25 @@ class TestTemplateRendering:
         assert "5" in index_html  # Total JSONL files (3+2)
         assert "23" in index_html  # Total messages (15+8)
 
-    def test_css_classes_applied(self):
+    def test_css_classes_applied(self, rendered_test_data: Dict[str, str]):
         """Test that correct CSS classes are applied to different message types."""
-        test_data_path = (
-            Path(__file__).parent / "test_data" / "representative_messages.jsonl"
-        )
+        html_content = rendered_test_data["representative_messages"]
 
-        html_file = convert_jsonl_to_html(test_data_path)
-        html_content = html_file.read_text(encoding="utf-8")
+        classes = class_values(html_content)
 
         # Check message type classes
-        assert "class='message user'" in html_content
-        assert "class='message assistant'" in html_content
+        assert "message user" in classes
+        assert "message assistant" in classes
         # Summary messages are now integrated into session headers
         assert "session-summary" in html_content or "Summary:" in html_content
 
         # Check tool message classes (tools are now top-level messages)
-        assert "class='message tool_use'" in html_content
-        assert "class='message tool_result'" in html_content
+        assert "message tool_use" in classes
+        assert "message tool_result" in classes
 
-    def test_server_side_markdown_rendering(self):
+    def test_server_side_markdown_rendering(self, rendered_test_data: Dict[str, str]):
         """Test that markdown is rendered server-side, not client-side."""
-        test_data_path = (
-            Path(__file__).parent / "test_data" / "representative_messages.jsonl"
-        )
-
-        html_file = convert_jsonl_to_html(test_data_path)
-        html_content = html_file.read_text(encoding="utf-8")
+        html_content = rendered_test_data["representative_messages"]
 
         # Should NOT have client-side JavaScript for markdown rendering
         assert "marked" not in html_content
@@ -282,7 +303,7 @@ class TestTemplateRendering:
             "<ul>" in html_content or "<ol>" in html_content
         )  # Lists should be rendered
 
-    def test_html_escaping(self):
+    def test_html_escaping(self, tmp_path):
         """Test that HTML special characters are properly escaped."""
         # Create test data with HTML characters
         test_data = {
@@ -306,24 +327,93 @@ class TestTemplateRendering:
             },
         }
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            jsonl_file = temp_path / "escape_test.jsonl"
+        jsonl_file = tmp_path / "escape_test.jsonl"
+
+        jsonl_file.write_bytes(orjson.dumps(test_data) + b"\n")
+
+        html_file = convert_jsonl_to_html(jsonl_file)
+        html_content = html_file.read_text(encoding="utf-8")
+
+        # Check that HTML is escaped
+        assert "&lt;script&gt;" in html_content
+        assert "&amp;" in html_content
+        assert "&quot;" in html_content
+        # Should not contain unescaped HTML
+        assert (
+            "<script>" not in html_content or html_content.count("<script>") <= 2
+        )  # Allow for the markdown script and search script
+
+    def test_write_html_matches_generate_html(
+        self, representative_messages: List[TranscriptEntry], tmp_path
+    ):
+        """Test that streaming HTML to a file produces the same output."""
+        output_path = tmp_path / "streamed.html"
+        write_html(output_path, representative_messages, "Streamed")
+
+        assert output_path.read_text(encoding="utf-8") == generate_html(
+            representative_messages, "Streamed"
+        )
+
+    def test_write_html_failure_keeps_previous_output(
+        self, representative_messages: List[TranscriptEntry], tmp_path
+    ):
+        """Test that a render failing partway leaves the previous file intact."""
+        output_path = tmp_path / "streamed.html"
+        write_html(output_path, representative_messages, "Streamed")
+        previous = output_path.read_text(encoding="utf-8")
+
+        real_context = renderer._transcript_template_context
+
+        def failing_context(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            context = real_context(*args, **kwargs)
+
+            def messages() -> Iterator[Any]:
+                yield from context["messages"]
+                raise RuntimeError("render interrupted")
 
-            with open(jsonl_file, "w", encoding="utf-8") as f:
-                f.write(json.dumps(test_data) + "\n")
+            return {**context, "messages": messages()}
 
-            html_file = convert_jsonl_to_html(jsonl_file)
-            html_content = html_file.read_text(encoding="utf-8")
+        with patch.object(renderer, "_transcript_template_context", failing_context):
+            with pytest.raises(RuntimeError, match="render interrupted"):
+                write_html(output_path, representative_messages, "Streamed")
 
-            # Check that HTML is escaped
-            assert "&lt;script&gt;" in html_content
-            assert "&amp;" in html_content
-            assert "&quot;" in html_content
-            # Should not contain unescaped HTML
-            assert (
-                "<script>" not in html_content or html_content.count("<script>") <= 2
-            )  # Allow for the markdown script and search script
+        assert output_path.read_text(encoding="utf-8") == previous
+        assert list(tmp_path.iterdir()) == [output_path]
+
+    def test_write_session_html_matches_generate_session_html(
+        self, representative_messages: List[TranscriptEntry], tmp_path
+    ):
+        """Test that streaming a session page produces the same output."""
+        session_id = next(
+            msg.sessionId
+            for msg in representative_messages
+            if hasattr(msg, "sessionId")
+        )
+        output_path = tmp_path / f"session-{session_id}.html"
+        write_session_html(output_path, representative_messages, session_id)
+
+        assert output_path.read_text(encoding="utf-8") == generate_session_html(
+            representative_messages, session_id
+        )
+
+    def test_write_projects_index_html_matches_generate(self, tmp_path):
+        """Test that streaming the projects index produces the same output."""
+        project_summaries = [
+            {
+                "name": "test-project-1",
+                "path": Path("/tmp/project1"),
+                "html_file": "test-project-1/combined_transcripts.html",
+                "jsonl_count": 3,
+                "message_count": 15,
+                "last_modified": 1700000000.0,
+            },
+        ]
+        output_path = tmp_path / "index.html"
+        write_projects_index_html(output_path, project_summaries, "yesterday")
+
+        assert output_path.read_text(encoding="utf-8") == generate_projects_index_html(
+            project_summaries, "yesterday"
+        )
 
 
 if __name__ == "__main__":
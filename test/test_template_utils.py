@@ -2,12 +2,13 @@
 """Unit tests for template utility functions and edge cases."""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 from claude_code_log.parser import parse_timestamp, extract_text_content
 from claude_code_log.renderer import (
     format_timestamp,
     extract_command_info,
     escape_html,
+    render_markdown,
 )
 from claude_code_log.models import TextContent, ToolUseContent, ToolResultContent
 
@@ -49,6 +50,17 @@ class TestTimestampHandling:
         result = parse_timestamp(invalid_timestamp)
         assert result is None
 
+    def test_timestamp_helpers_repeated_inputs(self):
+        """Test that repeated valid and invalid timestamps give the same results."""
+        timestamp = "2025-06-14T10:30:45.123Z"
+        expected = datetime(2025, 6, 14, 10, 30, 45, 123000, tzinfo=timezone.utc)
+
+        for _ in range(2):
+            assert parse_timestamp(timestamp) == expected
+            assert format_timestamp(timestamp) == "2025-06-14 10:30:45"
+            assert parse_timestamp("not-a-timestamp") is None
+            assert format_timestamp("not-a-timestamp") == "not-a-timestamp"
+
 
 class TestContentExtraction:
     """Test content extraction and text processing functions."""
@@ -62,6 +74,20 @@ class TestContentExtraction:
         result = extract_text_content(content_items)
         assert result == "First part\nSecond part"
 
+    def test_extract_text_content_single_item(self):
+        """Test extracting text content from a single text block."""
+        content_items = [TextContent(type="text", text="Only part")]
+        result = extract_text_content(content_items)
+        assert result == "Only part"
+
+    def test_extract_text_content_single_non_text_item(self):
+        """Test that a single non-text block yields no text."""
+        content_items = [
+            ToolUseContent(type="tool_use", id="tool_1", name="TestTool", input={})
+        ]
+        result = extract_text_content(content_items)
+        assert result == ""
+
     def test_extract_text_content_from_mixed_list(self):
         """Test extracting text content from mixed ContentItem list."""
         content_items = [
@@ -190,6 +216,15 @@ class TestEdgeCases:
         assert command_args == ""
         assert command_contents == ""
 
+    def test_render_markdown_matches_uncached_rendering(self):
+        """Test that repeated markdown text renders the same as uncached rendering."""
+        text = "Some **bold** text"
+        uncached = render_markdown.__wrapped__(text)
+
+        assert "<strong>bold</strong>" in uncached
+        assert render_markdown(text) == uncached
+        assert render_markdown(text) == uncached
+
     def test_escape_html_unicode(self):
         """Test escaping Unicode characters."""
         text = "Café & naïve résumé 中文"
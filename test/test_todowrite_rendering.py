@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 """Test cases for TodoWrite tool rendering."""
 
-import json
 import tempfile
 from pathlib import Path
+import orjson
 import pytest
 from claude_code_log.converter import convert_jsonl_to_html
 from claude_code_log.renderer import format_todowrite_content
@@ -199,8 +199,7 @@ class TestTodoWriteRendering:
             temp_path = Path(temp_dir)
             jsonl_file = temp_path / "todowrite_test.jsonl"
 
-            with open(jsonl_file, "w", encoding="utf-8") as f:
-                f.write(json.dumps(test_data) + "\n")
+            jsonl_file.write_bytes(orjson.dumps(test_data) + b"\n")
 
             html_file = convert_jsonl_to_html(jsonl_file)
             html_content = html_file.read_text(encoding="utf-8")
@@ -310,8 +309,7 @@ class TestTodoWriteRendering:
             temp_path = Path(temp_dir)
             jsonl_file = temp_path / "css_test.jsonl"
 
-            with open(jsonl_file, "w", encoding="utf-8") as f:
-                f.write(json.dumps(test_data) + "\n")
+            jsonl_file.write_bytes(orjson.dumps(test_data) + b"\n")
 
             html_file = convert_jsonl_to_html(jsonl_file)
             html_content = html_file.read_text(encoding="utf-8")
@@ -1,13 +1,13 @@
 #!/usr/bin/env python3
 """Tests for the TUI module."""
 
-import json
 import sys
 import tempfile
 from pathlib import Path
 from typing import cast
 from unittest.mock import Mock, patch
 
+import orjson
 import pytest
 from textual.css.query import NoMatches
 from textual.widgets import DataTable, Label
@@ -89,9 +89,9 @@ def temp_project_dir():
 
         # Write test data to JSONL file
         jsonl_file = project_path / "test-transcript.jsonl"
-        with open(jsonl_file, "w") as f:
-            for entry in test_data:
-                f.write(json.dumps(entry) + "\n")
+        jsonl_file.write_bytes(
+            b"".join(orjson.dumps(entry) + b"\n" for entry in test_data)
+        )
 
         yield project_path
 